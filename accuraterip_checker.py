@@ -3,15 +3,59 @@
 AccurateRip Checker - Verifies rips against the AccurateRip database
 """
 
-import hashlib
 import logging
+import mmap
 import requests
 import struct
-import subprocess
-import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+try:
+    # Optional: compiles the checksum loop to machine code (requires numpy)
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    njit = None
+    NUMBA_AVAILABLE = False
+
+# Samples per vectorised block; bounds the temporary uint64 product array to 8 MB
+CHECKSUM_BLOCK_SAMPLES = 1 << 20
+
+# Decimal digit sum of 0-999; a CD position in seconds (< 6000) is two lookups
+_DIGIT_SUMS = [sum(map(int, str(i))) for i in range(1000)]
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _checksum_kernel(samples, start_offset, end_offset, index_base):
+        """Compiled _checksum_range loop; returns the unmasked (lo, hi) product sums"""
+        csum_hi = np.uint64(0)
+        csum_lo = np.uint64(0)
+        for i in range(start_offset, end_offset):
+            product = np.uint64(samples[i]) * np.uint64(index_base + i + 1)
+            csum_hi += product >> np.uint64(32)
+            csum_lo += product  # Only the sum modulo 2^32 is used, so the low half needs no mask
+        return csum_lo, csum_hi
+
+def warm_checksum_kernel():
+    """
+    Compile (or load from numba's cache) the checksum kernel for the read-only PCM
+    views it is given, so the first rip does not pay for it; a no-op without Numba.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    samples = np.zeros(1, dtype=np.uint32)
+    samples.flags.writeable = False
+    _checksum_kernel(samples, 0, 1, 0)
 
 class AccurateRipChecker:
     """Checks ripped tracks against AccurateRip database"""
@@ -19,6 +63,8 @@ class AccurateRipChecker:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.accuraterip_url = "http://www.accuraterip.com/accuraterip"
+        # Database answers by URL (None for discs it does not have); network errors are not cached
+        self._lookup_cache: Dict[str, Optional[List[Dict]]] = {}
     
     def accuraterip_checksum(self, wav_path: str, track_number: int, total_tracks: int) -> Tuple[Optional[int], Optional[int]]:
         """
@@ -27,48 +73,118 @@ class AccurateRipChecker:
         Returns tuple of (v1_checksum, v2_checksum) or (None, None) on error.
         """
         try:
-            import wave
-            import struct
-            
-            with wave.open(wav_path, 'rb') as w:
-                if w.getnchannels() != 2 or w.getsampwidth() != 2 or w.getframerate() != 44100:
-                    self.logger.error(f"WAV file {wav_path} is not CD-quality (44.1kHz, 16-bit, stereo)")
-                    return None, None
-                
-                frames = w.readframes(w.getnframes())
-                if len(frames) == 0:
-                    self.logger.error(f"No audio data in {wav_path}")
+            with self.wav_audio(wav_path) as frames:
+                if frames is None:
                     return None, None
                 
-                # Convert to 32-bit integers (little-endian 16-bit samples)
-                audio_data = []
-                for i in range(0, len(frames), 4):  # 4 bytes = 2 samples * 2 bytes each
-                    if i + 3 < len(frames):
-                        # Combine left and right samples into one 32-bit value
-                        left = struct.unpack('<h', frames[i:i+2])[0]
-                        right = struct.unpack('<h', frames[i+2:i+4])[0]
-                        combined = (right << 16) | (left & 0xFFFF)
-                        audio_data.append(combined & 0xFFFFFFFF)
-                
-                if not audio_data:
-                    self.logger.error(f"Could not extract audio data from {wav_path}")
-                    return None, None
-                
-                return self._compute_checksums(audio_data, track_number, total_tracks)
+                # One 32-bit value per stereo frame: right sample in the high half, left in the low half
+                audio_data = self._pcm_samples(frames)
+                checksums = self._compute_checksums(audio_data, track_number, total_tracks) if len(audio_data) else None
+                # Drop the array before the mapping closes; it still references its pages
+                del audio_data
+            
+            if checksums is None:
+                self.logger.error(f"Could not extract audio data from {wav_path}")
+                return None, None
+            
+            return checksums
                 
         except Exception as e:
             self.logger.error(f"Error calculating AccurateRip checksum for {wav_path}: {e}")
             return None, None
     
-    def _compute_checksums(self, audio_data: List[int], track_number: int, total_tracks: int) -> Tuple[int, int]:
+    def accuraterip_checksums(self, wav_paths: List[Tuple[int, str]],
+                              total_tracks: int) -> Dict[int, Tuple[Optional[int], Optional[int]]]:
+        """
+        accuraterip_checksum for several tracks at once, as {track_number: (v1, v2)}.
+        
+        The tracks are checksummed concurrently, one per CPU: the Numba kernel runs
+        without the GIL and the NumPy path releases it for most of its work.
+        """
+        if len(wav_paths) < 2:
+            return {track: self.accuraterip_checksum(str(path), track, total_tracks) for track, path in wav_paths}
+        with ThreadPoolExecutor(max_workers=min(len(wav_paths), os.cpu_count() or 1)) as pool:
+            results = pool.map(lambda item: self.accuraterip_checksum(str(item[1]), item[0], total_tracks), wav_paths)
+            return dict(zip((track for track, _ in wav_paths), results))
+    
+    @contextmanager
+    def wav_audio(self, wav_path) -> Iterator[Optional[memoryview]]:
+        """
+        Map a WAV file and yield a zero-copy view of its PCM data chunk.
+        
+        Yields None (with the reason logged) if the file is empty, has no valid
+        RIFF/WAVE header or is not CD-quality; only the header pages are touched
+        then. Arrays made from the view must be dropped before the block ends.
+        """
+        with open(wav_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                self.logger.error(f"WAV file {wav_path} is empty")
+                yield None
+                return
+            
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            view = None
+            try:
+                wav_format = self._parse_wav_header(mm)
+                if wav_format is None:
+                    self.logger.error(f"WAV file {wav_path} has no valid RIFF/WAVE header")
+                elif wav_format[:3] != (2, 2, 44100):
+                    self.logger.error(f"WAV file {wav_path} is not CD-quality (44.1kHz, 16-bit, stereo)")
+                elif wav_format[4] == 0:
+                    self.logger.error(f"No audio data in {wav_path}")
+                else:
+                    data_offset, data_length = wav_format[3:]
+                    # The checksum reads the data chunk once, front to back: ask for aggressive
+                    # readahead now that the header is known to be good (MAP_POPULATE at map time
+                    # would fault in files that fail the header check too)
+                    for advice in ('MADV_SEQUENTIAL', 'MADV_WILLNEED'):
+                        if hasattr(mmap, advice):
+                            mm.madvise(getattr(mmap, advice))
+                    view = memoryview(mm)[data_offset:data_offset + data_length]
+                yield view
+            finally:
+                try:
+                    if view is not None:
+                        view.release()
+                    mm.close()
+                except BufferError:
+                    pass  # Something still references the pages (e.g. an exception traceback); unmapped when collected
+    
+    def _parse_wav_header(self, data) -> Optional[Tuple[int, int, int, int, int]]:
+        """
+        Walk the RIFF chunks of a WAV file held in a buffer.
+        
+        Returns (channels, sample_width, frame_rate, data_offset, data_length),
+        or None if the buffer is not a PCM WAV file.
+        """
+        if len(data) < 12 or data[:4] != b'RIFF' or data[8:12] != b'WAVE':
+            return None
+        
+        wav_format = None
+        pos = 12
+        while pos + 8 <= len(data):
+            chunk_id = data[pos:pos + 4]
+            chunk_size = struct.unpack_from('<I', data, pos + 4)[0]
+            body = pos + 8
+            if chunk_id == b'fmt ' and body + 16 <= len(data):
+                channels, frame_rate = struct.unpack_from('<HI', data, body + 2)
+                bits_per_sample = struct.unpack_from('<H', data, body + 14)[0]
+                wav_format = (channels, bits_per_sample // 8, frame_rate)
+            elif chunk_id == b'data':
+                if wav_format is None:
+                    return None
+                return wav_format + (body, min(chunk_size, len(data) - body))
+            # Chunks are padded to an even length
+            pos = body + chunk_size + (chunk_size & 1)
+        
+        return None
+    
+    def _compute_checksums(self, audio_data, track_number: int, total_tracks: int) -> Tuple[int, int]:
         """
         Compute AccurateRip v1 and v2 checksums from audio data.
         
         Implementation based on whipper's C extension.
         """
-        csum_hi = 0
-        csum_lo = 0
-        
         # AccurateRip skips first and last 5 sectors for first/last tracks
         sector_bytes = 2352  # bytes per CD sector
         samples_per_sector = sector_bytes // 4  # 4 bytes per sample (2 channels * 2 bytes)
@@ -89,8 +205,30 @@ class AccurateRipChecker:
             self.logger.warning(f"Track {track_number}: start_offset {start_offset} >= end_offset {end_offset}")
             return 0, 0
         
+        return self._checksum_range(audio_data, start_offset, end_offset)
+    
+    def _checksum_range(self, audio_data, start_offset: int, end_offset: int, index_base: int = 0) -> Tuple[int, int]:
+        """
+        (v1, v2) contribution of audio_data[start_offset:end_offset], where audio_data[0]
+        is sample number index_base of the track.
+        
+        Both checksums are sums modulo 2^32, so contributions of consecutive ranges
+        can simply be added together.
+        """
+        if NUMBA_AVAILABLE:
+            # Single pass with no temporaries; nogil lets concurrent verifications run in parallel
+            csum_lo, csum_hi = _checksum_kernel(np.asarray(audio_data, dtype=np.uint32), start_offset, end_offset, index_base)
+            csum_lo = int(csum_lo) & 0xFFFFFFFF
+            csum_hi = int(csum_hi) & 0xFFFFFFFF
+            return csum_lo, (csum_lo + csum_hi) & 0xFFFFFFFF
+        if NUMPY_AVAILABLE:
+            return self._compute_checksums_numpy(np.asarray(audio_data, dtype=np.uint32), start_offset, end_offset, index_base)
+        
+        csum_hi = 0
+        csum_lo = 0
+        
         for i in range(start_offset, end_offset):
-            multiplier = i + 1  # 1-based multiplier
+            multiplier = index_base + i + 1  # 1-based multiplier
             sample = audio_data[i]
             
             # Calculate product
@@ -109,6 +247,72 @@ class AccurateRipChecker:
         
         return v1, v2
     
+    def _compute_checksums_numpy(self, samples, start_offset: int, end_offset: int, index_base: int = 0) -> Tuple[int, int]:
+        """
+        Vectorised equivalent of the _checksum_range loop.
+        
+        The product and multiplier buffers are allocated once and reused for every
+        block, and the low halves are never masked out: the sum of the low 32 bits of
+        the products equals the sum of the products modulo 2^32.
+        """
+        if end_offset <= start_offset:
+            return 0, 0
+        
+        csum_hi = 0
+        csum_lo = 0
+        
+        block_size = min(CHECKSUM_BLOCK_SAMPLES, end_offset - start_offset)
+        steps = np.arange(1, block_size + 1, dtype=np.uint64)
+        multipliers = np.empty(block_size, dtype=np.uint64)
+        products = np.empty(block_size, dtype=np.uint64)
+        
+        for block_start in range(start_offset, end_offset, CHECKSUM_BLOCK_SAMPLES):
+            block_end = min(block_start + CHECKSUM_BLOCK_SAMPLES, end_offset)
+            count = block_end - block_start
+            block_products = products[:count]
+            
+            # sample < 2^32 and multiplier < 2^28, so every product fits in 64 bits
+            np.add(steps[:count], np.uint64(index_base + block_start), out=multipliers[:count])
+            np.multiply(samples[block_start:block_end], multipliers[:count], out=block_products)
+            
+            csum_lo += int(block_products.sum(dtype=np.uint64))
+            np.right_shift(block_products, np.uint64(32), out=block_products)
+            csum_hi += int(block_products.sum(dtype=np.uint64))
+        
+        csum_hi &= 0xFFFFFFFF
+        csum_lo &= 0xFFFFFFFF
+        
+        return csum_lo, (csum_lo + csum_hi) & 0xFFFFFFFF
+    
+    def _pcm_samples(self, audio_data) -> memoryview:
+        """
+        View raw 16-bit stereo PCM as one 32-bit sample per stereo frame.
+        
+        Accepts any bytes-like object (bytes, mmap, memoryview) without copying it.
+        """
+        view = memoryview(audio_data)
+        view = view[:len(view) - len(view) % 4]
+        if NUMPY_AVAILABLE:
+            return np.frombuffer(view, dtype='<u4')
+        return view.cast('I')
+    
+    def calculate_accuraterip_checksums(self, audio_data, track_number: int = 0, total_tracks: int = 0) -> Tuple[int, int]:
+        """
+        Calculate the AccurateRip (v1, v2) checksums of raw PCM data in a single pass.
+        
+        Both come from the same sample * index products, so callers that need both
+        should use this rather than the single-version helpers.
+        """
+        return self._compute_checksums(self._pcm_samples(audio_data), track_number, total_tracks)
+    
+    def _calculate_accuraterip_v1_checksum(self, audio_data, track_number: int = 0, total_tracks: int = 0) -> int:
+        """Calculate the AccurateRip v1 checksum of raw PCM data"""
+        return self.calculate_accuraterip_checksums(audio_data, track_number, total_tracks)[0]
+    
+    def _calculate_accuraterip_v2_checksum(self, audio_data, track_number: int = 0, total_tracks: int = 0) -> int:
+        """Calculate the AccurateRip v2 checksum of raw PCM data"""
+        return self.calculate_accuraterip_checksums(audio_data, track_number, total_tracks)[1]
+    
     def calculate_accuraterip_disc_ids(self, track_offsets: List[int]) -> Tuple[str, str, str]:
         """
         Calculate AccurateRip disc IDs based on track offsets.
@@ -157,9 +361,7 @@ class AccurateRipChecker:
         for offset in track_offsets:
             # Sum of digits of seconds
             seconds = offset // 75
-            while seconds > 0:
-                checksum += seconds % 10
-                seconds //= 10
+            checksum += _DIGIT_SUMS[seconds % 1000] + _DIGIT_SUMS[seconds // 1000]
         
         # Add number of tracks and total time
         total_time = (track_offsets[-1] + 150 * 75) // 75  # Approximate
@@ -193,18 +395,25 @@ class AccurateRipChecker:
         path = self.get_accuraterip_path(disc_id1, disc_id2, cddb_id, track_count)
         url = f"{self.accuraterip_url}/{path}"
         
+        if url in self._lookup_cache:
+            self.logger.debug(f"Using cached AccurateRip lookup: {url}")
+            return self._lookup_cache[url]
+        
         self.logger.info(f"Looking up AccurateRip database: {url}")
         
         try:
             response = requests.get(url, timeout=10)
             if response.status_code == 404:
                 self.logger.warning("Disc not found in AccurateRip database")
+                self._lookup_cache[url] = None
                 return None
             
             response.raise_for_status()
             
             # Parse binary response
-            return self._parse_accuraterip_response(response.content)
+            responses = self._parse_accuraterip_response(response.content)
+            self._lookup_cache[url] = responses
+            return responses
             
         except requests.RequestException as e:
             self.logger.error(f"Error accessing AccurateRip database: {e}")
@@ -257,59 +466,109 @@ class AccurateRipChecker:
         
         return responses
     
-    def verify_rip(self, output_dir: Path, track_offsets: List[int]) -> bool:
+    def track_checksum_table(self, responses: List[Dict]) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        Index database responses by track: {track_number: [(confidence, checksum), ...]}.
+        
+        Built once per disc so each track's checksums are matched with a dict lookup
+        instead of walking every response again.
+        """
+        table: Dict[int, List[Tuple[int, int]]] = {}
+        for response in responses:
+            for track_number, (confidence, checksum) in enumerate(zip(response['confidences'], response['checksums']), 1):
+                table.setdefault(track_number, []).append((confidence, int(checksum, 16)))
+        return table
+    
+    def match_track_checksums(self, table: Dict[int, List[Tuple[int, int]]],
+                              track_checksums: Dict[int, Dict[str, int]]) -> Dict[int, Dict[str, Any]]:
+        """
+        Match computed {track_number: {'v1', 'v2'}} checksums against track_checksum_table().
+        
+        Returns {track_number: {'v1': bool, 'v2': bool, 'confidence': int}}, the confidence
+        being the highest of the matching database entries (0 if none match).
+        """
+        results = {}
+        for track_number, checksums in track_checksums.items():
+            result = {'v1': False, 'v2': False, 'confidence': 0}
+            for confidence, db_checksum in table.get(track_number, ()):
+                for version in ('v1', 'v2'):
+                    if checksums[version] == db_checksum:
+                        result[version] = True
+                        result['confidence'] = max(result['confidence'], confidence)
+            results[track_number] = result
+        return results
+    
+    def verify_rip(self, output_dir: Path, track_offsets: List[int], wav_files: Optional[List[Path]] = None,
+                   responses: Optional[List[Dict]] = None,
+                   track_checksums: Optional[Dict[int, Tuple[int, int]]] = None) -> bool:
         """
         Verify all tracks in the output directory against AccurateRip database.
         
         Args:
             output_dir: Directory containing ripped WAV files
             track_offsets: List of track start offsets in CD frames
+            wav_files: Sorted WAV files already listed by the caller (scanned from output_dir if omitted)
+            responses: Database entries the caller already looked up (fetched here if omitted)
+            track_checksums: (v1, v2) by track number, computed by the caller during the rip;
+                if given, no WAV is read (a streamed rip never writes any)
             
         Returns:
             True if verification passes, False otherwise
         """
         try:
-            wav_files = sorted(list(output_dir.glob("*.wav")))
-            if not wav_files:
+            if track_checksums is not None:
+                wav_files = []
+            elif wav_files is None:
+                with os.scandir(output_dir) as entries:
+                    wav_files = sorted(Path(entry.path) for entry in entries
+                                       if entry.name.endswith('.wav') and entry.is_file())
+            if not wav_files and track_checksums is None:
                 self.logger.warning("No WAV files found for AccurateRip verification")
                 return False
             
-            self.logger.info(f"Starting AccurateRip verification for {len(wav_files)} tracks")
-            
-            # Calculate disc IDs
-            disc_id1, disc_id2, cddb_id = self.calculate_accuraterip_disc_ids(track_offsets)
-            self.logger.info(f"Disc IDs: ID1={disc_id1}, ID2={disc_id2}, CDDB={cddb_id}")
+            track_count = len(track_offsets) - 1 if track_checksums is not None else len(wav_files)
+            self.logger.info(f"Starting AccurateRip verification for {track_count} tracks")
             
-            # Look up in AccurateRip database
-            responses = self.lookup_accuraterip_database(disc_id1, disc_id2, cddb_id)
+            if responses is None:
+                # Calculate disc IDs
+                disc_id1, disc_id2, cddb_id = self.calculate_accuraterip_disc_ids(track_offsets)
+                self.logger.info(f"Disc IDs: ID1={disc_id1}, ID2={disc_id2}, CDDB={cddb_id}")
+                
+                # Look up in AccurateRip database (track_offsets ends with the leadout)
+                responses = self.lookup_accuraterip_database(disc_id1, disc_id2, cddb_id, len(track_offsets) - 1)
             if not responses:
                 self.logger.warning("Disc not found in AccurateRip database")
                 return False
             
             self.logger.info(f"Found {len(responses)} AccurateRip response(s)")
             
-            # Calculate checksums for all tracks
-            track_checksums = []
-            for i, wav_file in enumerate(wav_files):
-                track_number = i + 1
-                total_tracks = len(wav_files)
-                
-                v1, v2 = self.accuraterip_checksum(str(wav_file), track_number, total_tracks)
+            # Calculate checksums for all tracks (or take the ones computed during the rip)
+            if track_checksums is not None:
+                all_checksums = {track_number: track_checksums.get(track_number, (None, None))
+                                 for track_number in range(1, track_count + 1)}
+                sources = {track_number: 'checksummed during rip' for track_number in all_checksums}
+            else:
+                all_checksums = self.accuraterip_checksums(list(enumerate(wav_files, 1)), track_count)
+                sources = {track_number: wav_file.name for track_number, wav_file in enumerate(wav_files, 1)}
+            
+            checksum_list = []
+            for track_number in range(1, track_count + 1):
+                v1, v2 = all_checksums[track_number]
                 if v1 is None or v2 is None:
                     self.logger.error(f"Failed to calculate checksum for track {track_number}")
                     return False
                 
-                track_checksums.append({
+                checksum_list.append({
                     'track': track_number,
                     'v1': f"{v1:08x}",
                     'v2': f"{v2:08x}",
-                    'file': wav_file.name
+                    'file': sources[track_number]
                 })
                 
                 self.logger.debug(f"Track {track_number}: v1={v1:08x}, v2={v2:08x}")
             
             # Verify against database responses
-            return self._verify_checksums_against_responses(track_checksums, responses)
+            return self._verify_checksums_against_responses(checksum_list, responses)
             
         except Exception as e:
             self.logger.error(f"AccurateRip verification failed: {e}")
@@ -391,3 +650,49 @@ class AccurateRipChecker:
             result['error'] = str(e)
             
         return result
+
+
+class AccurateRipAccumulator:
+    """
+    Running AccurateRip v1/v2 checksums over raw CD PCM delivered in chunks,
+    e.g. while a track is piped from cd-paranoia into flac.
+    
+    Produces the same values as AccurateRipChecker.accuraterip_checksum on the
+    finished WAV without the PCM ever being written to or read back from disk.
+    """
+    
+    # AccurateRip skips the first and last 5 sectors for first/last tracks
+    SKIPPED_SAMPLES = 588 * 5
+    
+    def __init__(self, checker: AccurateRipChecker, track_number: int, total_tracks: int):
+        self.checker = checker
+        self.skip_start = self.SKIPPED_SAMPLES if track_number == 1 else 0
+        # The end of the last track is unknown until EOF, so hold its final samples back
+        self.hold_back_bytes = self.SKIPPED_SAMPLES * 4 if track_number == total_tracks else 0
+        self.position = 0  # Track sample index of the next unprocessed sample
+        self.pending = b''
+        self.v1 = 0
+        self.v2 = 0
+    
+    def update(self, data: bytes):
+        """Feed the next chunk of raw 16-bit stereo little-endian PCM"""
+        buffer = self.pending + data
+        usable = len(buffer) - self.hold_back_bytes
+        usable -= usable % 4
+        if usable <= 0:
+            self.pending = buffer
+            return
+        
+        samples = self.checker._pcm_samples(buffer[:usable])
+        start = min(max(self.skip_start - self.position, 0), len(samples))
+        if start < len(samples):
+            v1, v2 = self.checker._checksum_range(samples, start, len(samples), self.position)
+            self.v1 = (self.v1 + v1) & 0xFFFFFFFF
+            self.v2 = (self.v2 + v2) & 0xFFFFFFFF
+        
+        self.position += len(samples)
+        self.pending = buffer[usable:]
+    
+    def checksums(self) -> Tuple[int, int]:
+        """(v1, v2) of everything fed so far; held-back samples are the ones AccurateRip skips"""
+        return self.v1, self.v2
@@ -4,7 +4,6 @@ CD Monitor - Detects CD insertion and triggers ripping
 """
 
 import os
-import time
 import logging
 import threading
 import subprocess
@@ -20,10 +19,12 @@ class CDMonitor:
         self.logger = logging.getLogger(__name__)
         self.running = False
         self.last_disc_id = None
+        self._stop_event = threading.Event()
         
     def start_monitoring(self):
         """Start monitoring for CD insertion"""
         self.running = True
+        self._stop_event.clear()
         self.logger.info("Starting CD monitoring...")
         
         while self.running:
@@ -48,15 +49,17 @@ class CDMonitor:
                         self.logger.info("CD ejected")
                         self.last_disc_id = None
                 
-                time.sleep(2)  # Check every 2 seconds
+                # Check every 2 seconds; stop_monitoring() wakes this immediately
+                self._stop_event.wait(2)
                 
             except Exception as e:
                 self.logger.error(f"Error in CD monitoring: {e}")
-                time.sleep(5)  # Wait longer on error
+                self._stop_event.wait(5)  # Wait longer on error
     
     def stop_monitoring(self):
         """Stop monitoring"""
         self.running = False
+        self._stop_event.set()
         self.logger.info("Stopped CD monitoring")
     
     def _check_cd_inserted(self) -> bool:
@@ -65,15 +68,17 @@ class CDMonitor:
         
         try:
             # Try to read the CD table of contents
+            # Polled every couple of seconds; only stderr is inspected, and only for a
+            # substring, so skip stdout and decoding
             result = subprocess.run(
                 ['cd-paranoia', '-Q', '-d', device],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=10
             )
             
             # If cd-paranoia can read the TOC, a CD is present
-            return result.returncode == 0 and 'track' in result.stderr.lower()
+            return result.returncode == 0 and b'track' in result.stderr.lower()
             
         except subprocess.TimeoutExpired:
             return False
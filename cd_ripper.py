@@ -6,22 +6,77 @@ and fallback to cd-paranoia (libcdio-paranoia)
 """
 
 import os
+import queue
 import time
 import subprocess
 import logging
-import hashlib
-import json
 import re
+import threading
+import select
+import selectors
+import shutil
+import signal
+import socket
+import weakref
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 from metadata_fetcher import MetadataFetcher
-from cue_generator import CueGenerator
-from accuraterip_checker import AccurateRipChecker
+from cue_generator import CueGenerator, SANITIZE_TABLE
+from accuraterip_checker import AccurateRipChecker, AccurateRipAccumulator
 
 from toc_analyzer import TOCAnalyzer, DiscInfo
 
+# flac options describing cd-paranoia's raw (-r) output: 44.1 kHz, 16-bit signed, stereo, little-endian
+CD_RAW_PCM_FLAC_ARGS = [
+    '--force-raw-format',
+    '--endian=little',
+    '--sign=signed',
+    '--channels=2',
+    '--bps=16',
+    '--sample-rate=44100',
+]
+
+# Bytes of raw PCM in one CD sector (588 stereo 16-bit samples)
+CD_SECTOR_BYTES = 2352
+
+# Most PCM held in memory while relaying it from cd-paranoia to a slower flac
+RELAY_BUFFER_LIMIT = 1 << 20
+
+# How often a paused relay (see _run_cancellable_pipeline's relay_paused) is re-checked
+RELAY_PAUSE_POLL = 0.05  # seconds
+
+# Longest _kill_process_groups waits for SIGKILLed subprocesses to exit
+KILL_REAP_TIMEOUT = 1  # seconds
+
+# Number of stderr lines kept from a subprocess for error reporting
+STDERR_TAIL_LINES = 200
+
+# cd-paranoia stderr: "Ripping from sector   N (...)", "to sector   M (...)" and the
+# progress bar "(== PROGRESS == [ ... | 012345 00 ] == ... ==)"
+_PARANOIA_SECTOR_RE = re.compile(rb'(from|to) sector\s+(\d+)')
+_PARANOIA_PROGRESS_RE = re.compile(rb'PROGRESS == \[.*\|\s*(\d+)\s+\d+\s*\]')
+# Audio track line of cd-paranoia -Q: "track 01.  audio    00:32.17    760 [00:02.17]"
+_TOC_TRACK_RE = re.compile(r'^\s*track\s+(\d+)\.?\s+audio\s+(\S*:\S*)', re.MULTILINE)
+# cd-paranoia redraws its progress bar with \r, so stderr is split on both
+_STDERR_LINE_SPLIT_RE = re.compile(rb'[\r\n]')
+
+@lru_cache(maxsize=None)
+def _resolve_executable(name: str) -> str:
+    """Absolute path of a tool on PATH, looked up once instead of by every spawned child"""
+    return shutil.which(name) or name
+
+# How long get_status reuses the last drive probe while idle
+CD_PRESENT_CACHE_SECONDS = 0.5
+
+# Result object similar to subprocess.run's, returned by _run_cancellable_subprocess
+ProcessResult = namedtuple('ProcessResult', ('returncode', 'stdout', 'stderr'))
+
 class RipStatus:
     """Status tracking for rip operations"""
     IDLE = "idle"
@@ -36,9 +91,100 @@ class RipStatus:
     COMPLETED = "completed"
     ERROR = "error"
 
+# States in which the drive is in use by the rip itself
+_ACTIVE_STATES = frozenset({
+    RipStatus.READING_TOC,
+    RipStatus.FETCHING_METADATA,
+    RipStatus.RIPPING_BURST,
+    RipStatus.VERIFYING_ACCURATERIP,
+    RipStatus.RERIPPING_FAILED_TRACKS,
+    RipStatus.RIPPING_PARANOIA,
+    RipStatus.ENCODING,
+})
+
+class CancellationToken:
+    """
+    Cancellation flag that can be scoped to part of a rip.
+    
+    A child token counts as cancelled once it or any of its ancestors is, so
+    cancelling the root stops everything while cancelling a child only stops the
+    work that was handed that child. Wakers let a blocked waiter react at once
+    instead of polling is_cancelled().
+    """
+    
+    __slots__ = ('_event', '_parent', '_wakers')
+    
+    def __init__(self, parent: Optional['CancellationToken'] = None):
+        self._event = threading.Event()
+        self._parent = parent
+        self._wakers = set()
+    
+    def child(self) -> 'CancellationToken':
+        """Create a token that is cancelled along with this one"""
+        return CancellationToken(self)
+    
+    def add_waker(self, waker: Callable[[], None]):
+        """Call waker (from the cancelling thread) when this token or an ancestor is cancelled"""
+        token = self
+        while token is not None:
+            token._wakers.add(waker)
+            token = token._parent
+    
+    def remove_waker(self, waker: Callable[[], None]):
+        token = self
+        while token is not None:
+            token._wakers.discard(waker)
+            token = token._parent
+    
+    def cancel(self):
+        self._event.set()
+        for waker in list(self._wakers):
+            waker()
+    
+    def is_cancelled(self) -> bool:
+        token = self
+        while token is not None:
+            if token._event.is_set():
+                return True
+            token = token._parent
+        return False
+
+def _kill_process_groups(processes):
+    """
+    SIGKILL the process group of every still-running subprocess in processes and reap it.
+    
+    The reap waits at most KILL_REAP_TIMEOUT in all: a child stuck in uninterruptible
+    I/O on the drive ignores even SIGKILL, and is logged and left unreaped instead of
+    hanging the cancel or shutdown.
+    """
+    running = [process for process in list(processes) if process.poll() is None]
+    for process in running:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+    deadline = time.monotonic() + KILL_REAP_TIMEOUT
+    for process in running:
+        try:
+            process.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            logging.getLogger(__name__).warning(
+                f"Subprocess {process.pid} did not exit after SIGKILL (stuck in uninterruptible I/O?); not waiting for it")
+
 class CDRipper:
     """Main CD ripping class"""
     
+    # Fixed attribute set: get_status/cancel_rip are polled from the web UI, and slot
+    # access skips the instance dict. __weakref__ is needed for the process finalizer.
+    __slots__ = (
+        'config', 'logger', 'status', 'progress', 'current_track', 'total_tracks',
+        'error_message', 'rip_start_time', '_rip_start_iso', '_cancel_token', '_ar_responses',
+        '_ar_table', '_track_checksums', '_ar_failed_tracks',
+        'current_process', '_live_processes', '_finalizer', '_cd_present_cache',
+        'metadata_fetcher', 'cue_generator', 'accuraterip_checker', 'toc_analyzer',
+        'output_dir', '__weakref__',
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -48,8 +194,18 @@ class CDRipper:
         self.total_tracks = 0
         self.error_message = ""
         self.rip_start_time = None
-        self.cancel_requested = False
+        self._rip_start_iso = None  # rip_start_time.isoformat(), formatted once per rip for get_status
+        self._ar_responses = None  # AccurateRip database entries for the disc being ripped, if any
+        self._ar_table = {}  # The same entries by track number, see AccurateRipChecker.track_checksum_table
+        self._track_checksums = {}  # (v1, v2) of each track of this rip, for the final verification
+        self._ar_failed_tracks = set()  # Tracks of this rip kept despite not matching AccurateRip
+        self._cancel_token = CancellationToken()  # Root token; replaced at the start of each rip
         self.current_process = None
+        # Subprocesses started by _run_cancellable_pipeline that have not been reaped yet;
+        # killed if the ripper is collected or the interpreter exits mid-rip
+        self._live_processes = set()
+        self._finalizer = weakref.finalize(self, _kill_process_groups, self._live_processes)
+        self._cd_present_cache = (float('-inf'), False)  # (monotonic time checked, result)
         self.metadata_fetcher = MetadataFetcher(config)
         self.cue_generator = CueGenerator()
         self.accuraterip_checker = AccurateRipChecker()
@@ -62,8 +218,7 @@ class CDRipper:
     def rip_cd(self) -> bool:
         """Main CD ripping function"""
         try:
-            self.rip_start_time = datetime.now()
-            self.cancel_requested = False
+            self._begin_rip()
             self._update_status(RipStatus.READING_TOC)
             
             # Check for cancellation
@@ -102,6 +257,12 @@ class CDRipper:
                 
             metadata = self.metadata_fetcher.get_metadata(disc_info.to_dict())
             
+            # Look the disc up before ripping: if AccurateRip has no entry for it there is
+            # nothing to compare checksums against, so per-track checksumming is skipped
+            if self.config['ripping']['use_accuraterip']:
+                self._ar_responses = self._lookup_accuraterip(disc_info)
+                self._ar_table = self.accuraterip_checker.track_checksum_table(self._ar_responses or [])
+            
             # Create output directory for this album
             album_dir = self._create_album_directory(metadata)
             
@@ -124,12 +285,12 @@ class CDRipper:
                 if burst_success and self.config['ripping']['use_accuraterip']:
                     # AccurateRip verification was already done per-track during burst mode
                     self.logger.info("Per-track AccurateRip verification completed during burst mode")
-                    result = self._finalize_rip(disc_info, metadata, album_dir, skip_encoding=True)
+                    result = self._finalize_rip(disc_info, metadata, album_dir)
                     self._eject_cd()
                     return result
                 elif burst_success:
                     self.logger.info("Burst mode rip completed (AccurateRip verification disabled)")
-                    result = self._finalize_rip(disc_info, metadata, album_dir, skip_encoding=True)
+                    result = self._finalize_rip(disc_info, metadata, album_dir)
                     self._eject_cd()
                     return result
                 else:
@@ -146,7 +307,7 @@ class CDRipper:
                         self._update_status(RipStatus.IDLE, "Operation cancelled by user during paranoia mode")
                         self._eject_cd()
                         return False
-                    result = self._finalize_rip(disc_info, metadata, album_dir, skip_encoding=True)
+                    result = self._finalize_rip(disc_info, metadata, album_dir)
                     self._eject_cd()
                     return result
                 else:
@@ -201,37 +362,11 @@ class CDRipper:
     
     def _parse_toc_output(self, toc_output: str) -> Dict[str, Any]:
         """Parse cd-paranoia TOC output with robust error handling"""
-        tracks = []
-        lines = toc_output.strip().split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('track'):
-                try:
-                    # Parse track line: "track 01.  audio    00:32.17    760 [00:02.17]"
-                    parts = line.split()
-                    if len(parts) >= 4 and parts[2] == 'audio':
-                        # Validate track number
-                        track_str = parts[1].rstrip('.')
-                        if not track_str.isdigit():
-                            self.logger.warning(f"Invalid track number in TOC line: {line}")
-                            continue
-                        track_num = int(track_str)
-                        
-                        # Validate duration format
-                        duration = parts[3]
-                        if ':' not in duration:
-                            self.logger.warning(f"Invalid duration format in TOC line: {line}")
-                            continue
-                        
-                        tracks.append({
-                            'number': track_num,
-                            'duration': duration,
-                            'type': 'audio'
-                        })
-                except (ValueError, IndexError) as e:
-                    self.logger.warning(f"Failed to parse TOC line '{line}': {e}")
-                    continue
+        # Lines that don't match (headers, data tracks, malformed entries) are skipped
+        tracks = [
+            {'number': int(match.group(1)), 'duration': match.group(2), 'type': 'audio'}
+            for match in _TOC_TRACK_RE.finditer(toc_output)
+        ]
         
         if not tracks:
             self.logger.warning("No valid tracks found in TOC output")
@@ -275,94 +410,129 @@ class CDRipper:
     
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for filesystem compatibility"""
-        # Remove or replace problematic characters
-        chars_to_replace = {
-            '/': '-',
-            '\\': '-',
-            ':': ' -',
-            '*': '',
-            '?': '',
-            '"': "'",
-            '<': '(',
-            '>': ')',
-            '|': '-'
-        }
+        # Replace problematic characters (the table CueGenerator uses too), then collapse multiple spaces and trim
+        return ' '.join(filename.translate(SANITIZE_TABLE).split())
+
+    def _resolve_track_title(self, track_num: int, metadata: Optional[Dict[str, Any]]) -> str:
+        """Robustly get track title, fallback if missing, and log if metadata is missing"""
+        fallback_title = f'Track {track_num:02d}'
+        if metadata and metadata.get('tracks') and track_num <= len(metadata['tracks']):
+            track_meta = metadata['tracks'][track_num-1]
+            if not track_meta:
+                self.logger.warning(f"No metadata for track {track_num}, using fallback title '{fallback_title}'")
+                return fallback_title
+            title = track_meta.get('title')
+            if not title or not str(title).strip():
+                self.logger.warning(f"Missing or empty title for track {track_num}, using fallback title '{fallback_title}'")
+                return fallback_title
+            return str(title)
         
-        for char, replacement in chars_to_replace.items():
-            filename = filename.replace(char, replacement)
+        self.logger.warning(f"No metadata entry for track {track_num}, using fallback title '{fallback_title}'")
+        return fallback_title
+    
+    def _rip_track_batch(self, base_cmd: List[str], first: int, last: int, output_dir: Path, timeout: int) -> Dict[int, Path]:
+        """
+        Rip tracks first..last with one cd-paranoia run in batch mode.
         
-        # Remove multiple spaces and trim
-        filename = ' '.join(filename.split())
-        return filename.strip()
-
+        A single invocation reads the span continuously instead of re-opening the drive
+        and re-reading the TOC for every track. Returns {track_number: wav_file}, or an
+        empty dict if the batch failed and the caller should rip track by track.
+        """
+        # In batch mode cd-paranoia writes one file per track, named "trackNN.<output name>"
+        cmd = base_cmd + ['-B', f'{first}-{last}', str(output_dir / 'batch.wav')]
+        batch_files = {i: output_dir / f"track{i:02d}.batch.wav" for i in range(first, last + 1)}
+        
+        self.logger.info(f"Executing cd-paranoia command: {' '.join(cmd)}")
+        try:
+            result = self._run_cancellable_subprocess(cmd, timeout=timeout, capture_stdout=False)
+            if result.returncode == 0 and all(f.exists() for f in batch_files.values()):
+                return batch_files
+            self.logger.warning(f"Batch rip of tracks {first}-{last} failed, falling back to per-track ripping: {result.stderr}")
+        except subprocess.TimeoutExpired:
+            self.logger.warning(f"Batch rip of tracks {first}-{last} timed out, falling back to per-track ripping")
+        
+        for batch_file in batch_files.values():
+            if batch_file.exists():
+                batch_file.unlink()
+        return {}
+    
     def _rip_burst_mode(self, disc_info: DiscInfo, output_dir: Path, metadata: Dict[str, Any] = None) -> bool:
         """Rip in burst mode (fast) with immediate per-track encoding"""
         device = self.config['cd_drive']['device']
         tracks = disc_info.tracks
+        track_count = len(tracks)
         last_track_failed = False
         
+        # Drive settings are constant for the disc, so build the option lists once
+        offset = self.config['cd_drive']['offset']
+        offset_args = ['-O', str(offset)] if offset != 0 else []
+        overread_args = ['--force-overread'] if self.config['cd_drive'].get('force_overread', True) else []
+        
+        # Enhanced ripping with gap handling
+        cmd = [
+            'cd-paranoia',
+            '-d', device,
+            '-Z',  # Disable all paranoia checks for speed (burst mode)
+            '-z',  # Never ask, never tell
+        ] + offset_args
+        # Apply last track specific settings
+        last_track_cmd = ['cd-paranoia'] + overread_args + [
+            '-d', device,
+            '-z',  # Never ask, never tell
+            '-Z',  # Disable all paranoia checks for speed (burst mode)
+        ] + offset_args
+        
+        # Encoding/verification of ripped tracks, overlapped with ripping the next track
+        post_rip = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        finishing = []
         try:
+            track_titles = [self._resolve_track_title(i, metadata) for i in range(1, track_count + 1)]
+            
+            # Handle pre-gaps and HTOA
+            if tracks and tracks[0].has_htoa:
+                # Rip HTOA if present
+                htoa_file = output_dir / "00.wav"
+                htoa_cmd = cmd + [f'-{tracks[0].htoa_length//75}', str(htoa_file)]
+                self.logger.info(f"Ripping HTOA ({tracks[0].htoa_length/75:.2f} seconds)")
+                self._run_cancellable_subprocess(htoa_cmd, timeout=600, capture_stdout=False)
+            
+            # Read every track but the last in one continuous cd-paranoia run; the last
+            # track keeps its own invocation for overread handling and recovery
+            batch_cmd = cmd
+            batch_files = {}
+            batch_streamed = {}
+            # Rips go straight into flac; AccurateRip checksums are taken from the pipe
+            stream_to_flac = self.config['ripping'].get('stream_to_flac', True)
+            use_accuraterip = self.config['ripping']['use_accuraterip']
+            if track_count > 2:
+                self.logger.info(f"Ripping tracks 1-{track_count - 1} in a single burst pass...")
+                if stream_to_flac:
+                    batch_streamed = self._rip_span_to_flac(batch_cmd, 1, tracks[:-1], output_dir, metadata, track_count,
+                                                            timeout=600 * (track_count - 1),
+                                                            use_checksums=bool(use_accuraterip and self._ar_responses))
+                else:
+                    batch_files = self._rip_track_batch(batch_cmd, 1, track_count - 1, output_dir, timeout=600 * (track_count - 1))
+                if self._check_cancelled():
+                    return False
+            
             for i, track in enumerate(tracks, 1):
                 self.current_track = i
-                # Progress: 50% for ripping, 50% for encoding per track
-                base_progress = int((i - 1) / len(tracks) * 100)
-
-                # Get track title for logging
+                # Progress: ripping fills the first half of each track's share, its
+                # post-rip job the second half (see _update_post_rip_progress)
+                rip_span = (self.progress, self.progress + int(50 / track_count))
 
-                # Robustly get track title, fallback if missing, and log if metadata is missing
-                fallback_title = f'Track {i:02d}'
-                track_meta = None
-                track_title = None
-                if metadata and metadata.get('tracks') and i <= len(metadata['tracks']):
-                    track_meta = metadata['tracks'][i-1]
-                    if not track_meta:
-                        self.logger.warning(f"No metadata for track {i}, using fallback title '{fallback_title}'")
-                        track_title = fallback_title
-                    else:
-                        title = track_meta.get('title')
-                        if not title or not str(title).strip():
-                            self.logger.warning(f"Missing or empty title for track {i}, using fallback title '{fallback_title}'")
-                            track_title = fallback_title
-                        else:
-                            track_title = str(title)
-                else:
-                    self.logger.warning(f"No metadata entry for track {i}, using fallback title '{fallback_title}'")
-                    track_title = fallback_title
-
-                sanitized_title = self._sanitize_filename(track_title)
+                sanitized_title = self._sanitize_filename(track_titles[i - 1])
                 track_file = output_dir / f"{i:02d} - {sanitized_title}.wav"
 
                 self.logger.info(f"Track {i} output WAV filename: {track_file}")
 
-                # Enhanced ripping with gap handling
-                cmd = [
-                    'cd-paranoia',
-                    '-d', device,
-                    '-Z',  # Disable all paranoia checks for speed (burst mode)
-                    '-z',  # Never ask, never tell
-                ]
-                # Add offset to cmd if needed (before positional args)
-                if self.config['cd_drive']['offset'] != 0:
-                    cmd.extend(['-O', str(self.config['cd_drive']['offset'])])
                 # Standard track ripping
                 track_cmd = cmd + [f'{i}', str(track_file)]
-                # Apply last track specific settings
-                if i == len(tracks):
-                    track_cmd = [
-                        'cd-paranoia',
-                    ]
-                    if self.config['cd_drive'].get('force_overread', True):
-                        track_cmd.append('--force-overread')
+                if i == track_count:
+                    if overread_args:
                         self.logger.info(f"Drive supports overread: enabling --force-overread for last track.")
-                    track_cmd += [
-                        '-d', device,
-                        '-z',  # Never ask, never tell
-                        '-Z',  # Disable all paranoia checks for speed (burst mode)
-                    ]
-                    if self.config['cd_drive']['offset'] != 0:
-                        track_cmd.extend(['-O', str(self.config['cd_drive']['offset'])])
                     # Add track and output
-                    track_cmd.extend([f'{i}', str(track_file)])
+                    track_cmd = last_track_cmd + [f'{i}', str(track_file)]
                     # Extra validation: ensure output filename is not empty
                     if not str(track_file):
                         self.logger.error(f"BUG: Last track output filename is empty! Track {i}, track_file={track_file}")
@@ -371,24 +541,33 @@ class CDRipper:
                         self.logger.error(f"BUG: Last track cd-paranoia command missing output filename! Command: {' '.join(track_cmd)}")
                         raise RuntimeError(f"BUG: Last track cd-paranoia command missing output filename! Command: {' '.join(track_cmd)}")
                     self.logger.info(f"Last track special command: {' '.join(track_cmd)}")
-                # Handle pre-gaps and HTOA
-                if track.has_htoa and i == 1:
-                    # Rip HTOA if present
-                    htoa_file = output_dir / "00.wav"
-                    htoa_cmd = cmd.copy()
-                    htoa_cmd += [f'-{track.htoa_length//75}', str(htoa_file)]
-                    self.logger.info(f"Ripping HTOA ({track.htoa_length/75:.2f} seconds)")
-                    subprocess.run(htoa_cmd, capture_output=True, text=True, timeout=600)
-                # Debug: Log the exact command being executed
-                self.logger.info(f"Executing cd-paranoia command: {' '.join(track_cmd)}")
-
-                # Check for cancellation before ripping
-                if self._check_cancelled():
+                # Check for cancellation (or a failed encode of an earlier track) before ripping
+                if self._check_cancelled() or self._post_rip_failed(finishing):
                     return False
 
-                self.logger.info(f"Ripping track {i}...")
-                self.progress = base_progress
-                result = self._run_cancellable_subprocess(track_cmd, timeout=600)
+                encoded = False
+                streamed_checksums = None
+                if i in batch_streamed:
+                    self.logger.info(f"Track {i} was ripped and encoded in the burst pass")
+                    result = subprocess.CompletedProcess(batch_cmd, 0, '', '')
+                    encoded = True
+                    streamed_checksums = batch_streamed[i]
+                elif i in batch_files:
+                    batch_files[i].replace(track_file)
+                    self.logger.info(f"Track {i} was ripped in the burst pass")
+                    result = subprocess.CompletedProcess(batch_cmd, 0, '', '')
+                elif stream_to_flac:
+                    self.logger.info(f"Ripping track {i} straight to FLAC...")
+                    checksum = AccurateRipAccumulator(self.accuraterip_checker, i, track_count) if use_accuraterip and self._ar_responses else None
+                    result = self._rip_track_to_flac(track_cmd[:-2], i, output_dir, metadata, timeout=600, progress_span=rip_span, checksum=checksum)
+                    encoded = result.returncode == 0
+                    if encoded and checksum:
+                        streamed_checksums = checksum.checksums()
+                else:
+                    # Debug: Log the exact command being executed
+                    self.logger.info(f"Executing cd-paranoia command: {' '.join(track_cmd)}")
+                    self.logger.info(f"Ripping track {i}...")
+                    result = self._run_cancellable_subprocess(track_cmd, timeout=600, progress_span=rip_span, capture_stdout=False)
 
                 # Check for cancellation after ripping
                 if self._check_cancelled():
@@ -396,7 +575,7 @@ class CDRipper:
 
                 if result.returncode != 0:
                     # Last track failure handling
-                    if i == len(tracks):
+                    if i == track_count:
                         self.logger.warning(f"Last track {i} failed with standard settings")
                         self.logger.error(f"Error: {result.stderr}")
                         
@@ -407,18 +586,19 @@ class CDRipper:
                             '-d', device,
                             '-z',  # Never ask, never tell
                             '-Y',  # Most lenient paranoia mode
-                        ]
-                        if self.config['cd_drive'].get('force_overread', True):
-                          track_cmd.append('--force-overread')
-                          self.logger.info(f"Drive supports overread: enabling --force-overread for last track.")
-
-                        if self.config['cd_drive']['offset'] != 0:
-                            recovery_cmd.extend(['-O', str(self.config['cd_drive']['offset'])])
-                        
-                        recovery_cmd.extend([f'{i}', str(track_file)])
+                        ] + overread_args + offset_args + [f'{i}', str(track_file)]
                         
                         self.logger.info(f"Recovery command: {' '.join(recovery_cmd)}")
-                        recovery_result = self._run_cancellable_subprocess(recovery_cmd, timeout=900)
+                        if stream_to_flac:
+                            # Recover through the flac pipe too; no WAV is written for the last track
+                            checksum = AccurateRipAccumulator(self.accuraterip_checker, i, track_count) if use_accuraterip and self._ar_responses else None
+                            recovery_result = self._rip_track_to_flac(recovery_cmd[:-2], i, output_dir, metadata, timeout=900,
+                                                                      progress_span=rip_span, checksum=checksum)
+                            encoded = recovery_result.returncode == 0
+                            if encoded and checksum:
+                                streamed_checksums = checksum.checksums()
+                        else:
+                            recovery_result = self._run_cancellable_subprocess(recovery_cmd, timeout=900, progress_span=rip_span, capture_stdout=False)
                         
                         if recovery_result.returncode == 0:
                             self.logger.info("Last track recovery successful!")
@@ -433,40 +613,14 @@ class CDRipper:
                         self.logger.error(f"Failed to rip track {i}: {result.stderr}")
                         return False
                 
-                self.logger.info(f"Ripped track {i}, now encoding to FLAC...")
-                
-                # Immediately encode this track to FLAC
-                self.progress = base_progress + int(25 / len(tracks))  # 25% for encoding
-                if not self._encode_single_track(i, track, track_file, output_dir, metadata):
-                    return False
-                
-                # Check for cancellation after encoding
-                if self._check_cancelled():
-                    return False
-                
-                # Immediately verify with AccurateRip if enabled
-                track_verified = True
-                if self.config['ripping']['use_accuraterip']:
-                    self.logger.info(f"Verifying track {i} with AccurateRip...")
-                    self.progress = base_progress + int(40 / len(tracks))  # +15% for verification
-                    track_verified = self._verify_single_track_accuraterip(i, track_file, disc_info)
-                    
-                    if not track_verified:
-                        self.logger.warning(f"Track {i} failed AccurateRip verification")
-                        # Mark for re-ripping later, but continue with other tracks
-                        # We'll handle failed tracks after all tracks are processed
-                
-                # Delete WAV file immediately after verification
-                if track_file.exists():
-                    track_file.unlink()
-                    self.logger.debug(f"Deleted WAV file for track {i}")
-                
-                # Check for cancellation after verification
-                if self._check_cancelled():
-                    return False
-                
-                self.logger.info(f"Completed track {i} (ripped, encoded, {'AccurateRip verified' if track_verified else 'AccurateRip: no database entry'})")
-                self.progress = int(i / len(tracks) * 100)
+                # Encode and verify this track in the background while the next one rips
+                future = post_rip.submit(self._finish_track, i, track, track_file, output_dir, metadata,
+                                         disc_info, encoded, streamed_checksums)
+                finishing.append(future)
+                future.add_done_callback(lambda _: self._update_post_rip_progress(finishing, track_count))
+            
+            if not all(future.result() for future in finishing):
+                return False
             
             # If only the last track failed, we have a partial success
             if last_track_failed:
@@ -481,63 +635,314 @@ class CDRipper:
         except Exception as e:
             self.logger.error(f"Burst mode ripping failed: {e}")
             return False
+        finally:
+            # Drop queued work on an early return; running encodes finish (or see the cancel)
+            post_rip.shutdown(cancel_futures=True)
     
-    def _encode_single_track(self, track_num: int, track_info: Any, wav_file: Path, output_dir: Path, metadata: Dict[str, Any] = None) -> bool:
-        """Encode a single track to FLAC and delete the WAV file"""
-        if not wav_file.exists():
-            self.logger.error(f"WAV file not found: {wav_file}")
-            return False
-        
-        # Check for cancellation before encoding
-        if self._check_cancelled():
-            self.logger.info("Track encoding cancelled by user")
+    def _finish_track(self, track_num: int, track: Any, track_file: Path, output_dir: Path, metadata: Dict[str, Any],
+                      disc_info: DiscInfo, encoded: bool, streamed_checksums: Optional[Tuple[int, int]]) -> bool:
+        """
+        Encode (unless the rip already streamed into flac), AccurateRip-check and clean up
+        one ripped track. Runs on the rip modes' post-rip executor, so it overlaps with
+        ripping the next track; False if the track could not be encoded.
+        """
+        try:
+            if not encoded:
+                self.logger.info(f"Ripped track {track_num}, now encoding to FLAC...")
+                if not self._encode_single_track(track_num, track, track_file, output_dir, metadata):
+                    return False
+            
+            # Check for cancellation after encoding
+            if self._check_cancelled():
+                return False
+            
+            # Verify with AccurateRip if enabled; failures are reported but the track is kept
+            track_verified = True
+            if self.config['ripping']['use_accuraterip']:
+                self.logger.info(f"Verifying track {track_num} with AccurateRip...")
+                track_verified = self._verify_single_track_accuraterip(track_num, track_file, disc_info, streamed_checksums)
+                # Reported in get_status and rip.log; a later re-rip of the track can clear it
+                if track_verified:
+                    self._ar_failed_tracks.discard(track_num)
+                else:
+                    self._ar_failed_tracks.add(track_num)
+                    self.logger.warning(f"Track {track_num} failed AccurateRip verification")
+            
+            # Delete the WAV file to save space (we have the FLAC now)
+            if track_file.exists():
+                track_file.unlink()
+                self.logger.debug(f"Deleted WAV file for track {track_num}")
+            
+            # Nothing here reads the FLAC again; don't let it crowd the page cache
+            self._release_page_cache(self._flac_file(track_num, output_dir, metadata))
+            
+            verification_status = "verified" if track_verified else "verification failed"
+            self.logger.info(f"Completed track {track_num} (ripped, encoded, {verification_status})")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to finish track {track_num}: {e}")
             return False
+    
+    def _release_page_cache(self, path: Path):
+        """
+        Ask the kernel to write back and drop the cached pages of a finished output file.
         
-        # Get track metadata
-        track_meta = {}
-        if metadata and metadata.get('tracks') and track_num <= len(metadata['tracks']):
-            track_meta = metadata['tracks'][track_num-1]
+        Deleted WAVs free their pages on unlink; the FLACs would otherwise stay cached
+        and compete with the WAVs still being checksummed. A no-op where posix_fadvise
+        is unavailable.
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            self.logger.debug(f"Could not release page cache for {path}: {e}")
+    
+    def _update_post_rip_progress(self, finishing: List, track_count: int, skipped: int = 0):
+        """
+        Advance progress from the post-rip jobs: a track's rip fills the first half of its
+        share once its job is submitted, the job's completion the second half. skipped
+        tracks (already delivered) count as fully done. Called from the jobs' done-callbacks,
+        so progress only ever moves forward.
+        """
+        finished = sum(future.done() for future in finishing)
+        self.progress = max(self.progress, int((2 * skipped + len(finishing) + finished) * 50 / track_count))
+    
+    def _post_rip_failed(self, finishing: List) -> bool:
+        """True once any finished _finish_track job has failed"""
+        return any(future.done() and not future.result() for future in finishing)
+    
+    def _build_flac_command(self, track_num: int, output_dir: Path, metadata: Dict[str, Any] = None,
+                            total_tracks: Optional[int] = None) -> Tuple[List[str], Path]:
+        """
+        Build the flac command (without its input argument) and output path for a track.
         
-        flac_file = output_dir / f"{track_num:02d} - {self._sanitize_filename(track_meta.get('title', f'Track {track_num:02d}'))}.flac"
+        TOTALTRACKS is total_tracks if given, else the number of tracks in metadata.
+        """
+        flac_file = self._flac_file(track_num, output_dir, metadata)
         
         # Build FLAC encoding command
         cmd = [
             'flac',
             '-f',  # Force overwrite existing files
+            '--silent',  # No per-file progress on stderr; errors are still reported
             f'--compression-level-{self.config["output"]["compression_level"]}',
-            # Note: NOT using --delete-input-file to keep WAV for AccurateRip verification
             f'--output-name={flac_file}',
         ]
         
-        # Add metadata tags
+        # Add metadata tags, all in one extend
+        cmd.extend(arg for name, value in self._flac_tags(track_num, metadata, total_tracks)
+                   for arg in ('--tag', f'{name}={value}'))
+        
+        return cmd, flac_file
+    
+    def _flac_file(self, track_num: int, output_dir: Path, metadata: Dict[str, Any] = None) -> Path:
+        """Output path of a track's FLAC, for callers that don't need the whole flac command"""
+        track_meta = {}
+        if metadata and metadata.get('tracks') and track_num <= len(metadata['tracks']):
+            track_meta = metadata['tracks'][track_num-1]
+        return output_dir / f"{track_num:02d} - {self._sanitize_filename(track_meta.get('title', f'Track {track_num:02d}'))}.flac"
+    
+    def _flac_tags(self, track_num: int, metadata: Dict[str, Any] = None,
+                   total_tracks: Optional[int] = None) -> List[Tuple[str, str]]:
+        """Vorbis comments for a track as (name, value) pairs, in the order flac is given them"""
+        track_meta = {}
+        if metadata and metadata.get('tracks') and track_num <= len(metadata['tracks']):
+            track_meta = metadata['tracks'][track_num-1]
+        
+        tags = []
         if metadata:
             if metadata.get('artist'):
-                cmd.extend(['--tag', f'ARTIST={metadata["artist"]}'])
+                tags.append(('ARTIST', metadata['artist']))
             if metadata.get('album'):
-                cmd.extend(['--tag', f'ALBUM={metadata["album"]}'])
+                tags.append(('ALBUM', metadata['album']))
             if metadata.get('date'):
-                cmd.extend(['--tag', f'DATE={metadata["date"]}'])
+                tags.append(('DATE', metadata['date']))
         
         if track_meta.get('title'):
-            cmd.extend(['--tag', f'TITLE={track_meta["title"]}'])
+            tags.append(('TITLE', track_meta['title']))
         if track_meta.get('artist'):
-            cmd.extend(['--tag', f'ARTIST={track_meta["artist"]}'])
+            tags.append(('ARTIST', track_meta['artist']))
+        
+        # Add track number tags
+        if total_tracks is None:
+            total_tracks = len(metadata.get('tracks', [])) if metadata else 1
+        tags.append(('TRACKNUMBER', str(track_num)))
+        tags.append(('TOTALTRACKS', str(total_tracks)))
+        return tags
+    
+    def _rip_track_to_flac(self, rip_cmd: List[str], track_num: int, output_dir: Path, metadata: Dict[str, Any] = None,
+                           timeout: int = 600, progress_span: Optional[Tuple[int, int]] = None,
+                           checksum: Optional[AccurateRipAccumulator] = None):
+        """
+        Rip a track straight into flac without writing a WAV.
+        
+        rip_cmd is a cd-paranoia command without its track/output arguments; it is run
+        with raw output to stdout, piped into flac reading raw CD PCM from stdin.
+        If checksum is given, the PCM is relayed through it on the way to flac.
+        Returns the pipeline result; a partial FLAC is removed on failure.
+        """
+        flac_cmd, flac_file = self._build_flac_command(track_num, output_dir, metadata)
+        pipeline = [
+            rip_cmd + ['-r', f'{track_num}', '-'],
+            flac_cmd + CD_RAW_PCM_FLAC_ARGS + ['-'],
+        ]
+        self.logger.info(f"Executing pipeline: {' '.join(pipeline[0])} | {' '.join(pipeline[1])}")
         
-        # Calculate dynamic timeout based on track duration
         try:
-            # TrackInfo has length_seconds property
-            if hasattr(track_info, 'length_seconds'):
-                track_minutes = track_info.length_seconds / 60.0
-            else:
-                track_minutes = 4.0  # Fallback
-            encoding_timeout = max(120, int(track_minutes * 3 + 60))  # Min 2 minutes, scale with length
-        except (AttributeError, TypeError):
-            encoding_timeout = 300  # Fallback for any errors
+            result = self._run_cancellable_pipeline(pipeline, timeout=timeout, progress_span=progress_span,
+                                                    relay=checksum.update if checksum else None, capture_stdout=False)
+        except subprocess.TimeoutExpired:
+            if flac_file.exists():
+                flac_file.unlink()
+            raise
+        
+        if result.returncode != 0 and flac_file.exists():
+            flac_file.unlink()
+        return result
+    
+    def _rip_span_to_flac(self, rip_cmd: List[str], first: int, tracks: List[Any], output_dir: Path,
+                          metadata: Dict[str, Any], total_tracks: int, timeout: int,
+                          use_checksums: bool) -> Dict[int, Optional[Tuple[int, int]]]:
+        """
+        Rip consecutive tracks with one cd-paranoia run straight into one flac per track.
+        
+        Like _rip_track_batch the span is read continuously, but as raw PCM on stdout
+        that is cut at the TOC track boundaries and written to each track's flac, so no
+        WAV is written. Each flac is fed by its own writer thread, so a slow encoder only
+        pauses reading cd-paranoia instead of blocking the pipeline's loop. Returns
+        {track_number: (v1, v2) or None} for the tracks that were encoded; empty if the
+        rip failed (or its length disagrees with the TOC) and the caller should rip
+        track by track.
+        """
+        last = first + len(tracks) - 1
+        cmd = rip_cmd + ['-r', f'{first}-{last}', '-']
+        expected_bytes = sum(track.length_sectors for track in tracks) * CD_SECTOR_BYTES
+        # One entry per track in disc order: [number, bytes still due, flac file, accumulator, flac process,
+        # queue of PCM for its writer thread, writer thread]
+        encoders = []
+        for number, track in enumerate(tracks, first):
+            checksum = AccurateRipAccumulator(self.accuraterip_checker, number, total_tracks) if use_checksums else None
+            encoders.append([number, track.length_sectors * CD_SECTOR_BYTES,
+                             self._flac_file(number, output_dir, metadata), checksum, None, None, None])
+        upcoming = iter(encoders)
+        current = None
+        received = 0
+        
+        def feed(process: subprocess.Popen, pieces: queue.Queue):
+            """Write queued PCM to one flac's stdin until the None that ends its track"""
+            broken = False
+            for piece in iter(pieces.get, None):
+                if broken:
+                    continue  # Keep draining, so a failed flac never pauses the rip
+                try:
+                    process.stdin.write(piece)
+                except (BrokenPipeError, ValueError):
+                    broken = True  # flac gave up (or was killed); its returncode reports the failure
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+        
+        def split(chunk: bytes):
+            """Hand each byte of the span to the writer of the track it belongs to"""
+            nonlocal current, received
+            received += len(chunk)
+            view = memoryview(chunk)
+            while view:
+                if current is None or current[1] == 0:
+                    current = next(upcoming, None)
+                    if current is None:
+                        return  # Audio past the end of the span's TOC entries; caught by the length check
+                    flac_cmd = self._build_flac_command(current[0], output_dir, metadata)[0]
+                    current[4] = subprocess.Popen(flac_cmd + CD_RAW_PCM_FLAC_ARGS + ['-'], stdin=subprocess.PIPE,
+                                                  stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                                  executable=_resolve_executable(flac_cmd[0]),
+                                                  start_new_session=True)
+                    self._live_processes.add(current[4])
+                    current[5] = queue.Queue()
+                    current[6] = threading.Thread(target=feed, args=(current[4], current[5]),
+                                                  name=f'flac-feed-{current[0]}', daemon=True)
+                    current[6].start()
+                piece, view = view[:current[1]], view[current[1]:]
+                current[1] -= len(piece)
+                if current[3]:
+                    current[3].update(piece)
+                current[5].put(piece)
+                if current[1] == 0:
+                    current[5].put(None)  # Track complete; its flac sees EOF once the writer catches up
+        
+        def encoders_behind() -> bool:
+            """Whether the writers hold RELAY_BUFFER_LIMIT of PCM flac hasn't taken yet (chunks are <= 64 KiB)"""
+            return sum(pieces.qsize() for *_, pieces, _ in encoders if pieces) * 65536 >= RELAY_BUFFER_LIMIT
+        
+        def finish_writers(timeout: Optional[float] = None):
+            """End every writer's queue and wait for it, for at most timeout seconds in all if given"""
+            deadline = None if timeout is None else time.monotonic() + timeout
+            for *_, pieces, writer in encoders:
+                if writer is not None:
+                    pieces.put(None)
+                    writer.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        
+        self.logger.info(f"Executing pipeline: {' '.join(cmd)} | flac (tracks {first}-{last})")
+        encoded = {}
+        try:
+            result = self._run_cancellable_pipeline([cmd], timeout=timeout, relay=split, relay_paused=encoders_behind)
+            finish_writers()
+            if result.returncode != 0:
+                self.logger.warning(f"Streamed rip of tracks {first}-{last} failed, falling back to per-track ripping: {result.stderr}")
+            elif received != expected_bytes:
+                self.logger.warning(f"Streamed rip of tracks {first}-{last} returned {received} bytes but the TOC "
+                                    f"gives {expected_bytes}, falling back to per-track ripping")
+            
+            for number, remaining, flac_file, checksum, process, _, _ in encoders:
+                if process is None:
+                    continue
+                errors = process.stderr.read().decode('utf-8', errors='replace')
+                if process.wait() != 0:
+                    self.logger.error(f"Failed to encode track {number} to FLAC: {errors}")
+                elif result.returncode == 0 and received == expected_bytes and remaining == 0:
+                    encoded[number] = checksum.checksums() if checksum else None
+        except subprocess.TimeoutExpired:
+            self.logger.warning(f"Streamed rip of tracks {first}-{last} timed out, falling back to per-track ripping")
+        finally:
+            # Encoders still running here were abandoned by a timeout or error
+            started = [encoder[4] for encoder in encoders if encoder[4] is not None]
+            _kill_process_groups(started)
+            # A killed flac fails its writer's next write at once; one that outlived the kill
+            # (see _kill_process_groups) leaves its daemon writer blocked, so don't wait on it
+            finish_writers(KILL_REAP_TIMEOUT)
+            for process in started:
+                process.stderr.close()
+            self._live_processes.difference_update(started)
+            for number, _, flac_file, *_ in encoders:
+                if number not in encoded and flac_file.exists():
+                    flac_file.unlink()
+        return encoded
+    
+    def _encode_single_track(self, track_num: int, track_info: Any, wav_file: Path, output_dir: Path, metadata: Dict[str, Any] = None) -> bool:
+        """Encode a single track to FLAC and delete the WAV file"""
+        if not wav_file.exists():
+            self.logger.error(f"WAV file not found: {wav_file}")
+            return False
+        
+        # Check for cancellation before encoding
+        if self._check_cancelled():
+            self.logger.info("Track encoding cancelled by user")
+            return False
+        
+        # Note: NOT using --delete-input-file to keep WAV for AccurateRip verification
+        cmd, flac_file = self._build_flac_command(track_num, output_dir, metadata)
+        
+        # Calculate dynamic timeout based on track duration (same rule as the batch encode)
+        track_minutes = track_info.length_seconds / 60 if track_info.length_seconds > 0 else 4.0
+        encoding_timeout = max(120, int(track_minutes * 3 + 60))  # Min 2 minutes, scale with length
         
-        # Add track number tags
-        total_tracks = len(metadata.get('tracks', [])) if metadata else 1
-        cmd.extend(['--tag', f'TRACKNUMBER={track_num}'])
-        cmd.extend(['--tag', f'TOTALTRACKS={total_tracks}'])
         cmd.append(str(wav_file))
         
         # Validate WAV file before encoding
@@ -560,7 +965,7 @@ class CDRipper:
         self.logger.debug(f"Using {encoding_timeout}s timeout for track {track_num} ({track_minutes:.1f} minutes)")
         
         # Use cancellable subprocess for FLAC encoding
-        result = self._run_cancellable_subprocess(cmd, timeout=encoding_timeout)
+        result = self._run_cancellable_subprocess(cmd, timeout=encoding_timeout, capture_stdout=False)
         
         # Check for cancellation after encoding
         if self._check_cancelled():
@@ -578,20 +983,41 @@ class CDRipper:
         self.logger.info(f"Encoded track {track_num} to FLAC")
         return True
     
-    def _verify_single_track_accuraterip(self, track_num: int, wav_file: Path, disc_info) -> bool:
-        """Verify a single track against AccurateRip and return True if verified or no data available"""
+    def _verify_single_track_accuraterip(self, track_num: int, wav_file: Path, disc_info,
+                                         checksums: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        Verify a single track against AccurateRip and return True if verified or no data available.
+        
+        checksums are the (v1, v2) values already computed while the track was streamed;
+        only without them is the WAV file read.
+        """
         try:
-            if not wav_file.exists():
-                self.logger.error(f"WAV file not found for verification: {wav_file}")
-                return False
-            
-            # Calculate AccurateRip checksums for this track
-            v1, v2 = self.accuraterip_checker.accuraterip_checksum(str(wav_file), track_num, len(disc_info.tracks))
+            if checksums is not None:
+                v1, v2 = checksums
+            elif not self._ar_responses:
+                # Disc not in the AccurateRip database: don't read the whole WAV for nothing
+                self.logger.info(f"Track {track_num}: no AccurateRip data for this disc, skipping checksum")
+                return True
+            else:
+                if not wav_file.exists():
+                    self.logger.error(f"WAV file not found for verification: {wav_file}")
+                    return False
+                
+                # Calculate AccurateRip checksums for this track
+                v1, v2 = self.accuraterip_checker.accuraterip_checksum(str(wav_file), track_num, len(disc_info.tracks))
             
             if v1 is not None and v2 is not None:
                 self.logger.info(f"Track {track_num}: AccurateRip checksums calculated - v1={v1:08x}, v2={v2:08x}")
-                # Note: Full database verification happens during finalization
-                return True
+                # A re-rip replaces the track's earlier checksums
+                self._track_checksums[track_num] = (v1, v2)
+                # Match against the entries fetched at rip start; no further database requests
+                match = self.accuraterip_checker.match_track_checksums(self._ar_table, {track_num: {'v1': v1, 'v2': v2}})[track_num]
+                passed, match_type = self._accuraterip_verdict(match)
+                if passed:
+                    self.logger.info(f"Track {track_num}: AccurateRip ✅ ({match_type}, confidence {match['confidence']})")
+                    return True
+                self.logger.warning(f"Track {track_num}: AccurateRip ❌ ({match_type})")
+                return False
             else:
                 self.logger.warning(f"Track {track_num}: Failed to calculate AccurateRip checksums")
                 return False
@@ -604,77 +1030,70 @@ class CDRipper:
         """Rip in paranoia mode (slow but accurate) with per-track encoding and verification"""
         device = self.config['cd_drive']['device']
         tracks = disc_info.tracks
+        track_count = len(tracks)
+        
+        # Drive settings are constant for the disc, so build the option lists once
+        offset = self.config['cd_drive']['offset']
+        offset_args = ['-O', str(offset)] if offset != 0 else []
+        force_overread = self.config['cd_drive'].get('force_overread', True)
+        
+        # Use cd-paranoia in paranoia mode
+        base_cmd = [
+            'cd-paranoia',
+            '-d', device,
+            '-z',  # Never ask, never tell
+        ] + offset_args
         
+        # Encoding/verification of ripped tracks, overlapped with ripping the next track
+        post_rip = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        finishing = []
+        skipped = 0  # Tracks burst mode already delivered as FLAC
         try:
+            track_titles = [self._resolve_track_title(i, metadata) for i in range(1, track_count + 1)]
+            
+            # Tracks that burst mode did not already deliver as FLAC
+            pending = [
+                i for i in range(1, track_count + 1)
+                if not (output_dir / f"{i:02d} - {self._sanitize_filename(track_titles[i - 1])}.flac").exists()
+            ]
+            
+            # Read a contiguous run of pending tracks (excluding the last track, which needs
+            # its lenient settings) with a single cd-paranoia invocation
+            batch_cmd = base_cmd
+            # Per-track rips go straight into flac; AccurateRip checksums are taken from the pipe
+            stream_to_flac = self.config['ripping'].get('stream_to_flac', True)
+            use_accuraterip = self.config['ripping']['use_accuraterip']
+            batch_span = [i for i in pending if i < track_count]
+            batch_files = {}
+            if len(batch_span) > 1 and batch_span == list(range(batch_span[0], batch_span[-1] + 1)):
+                self.logger.info(f"Ripping tracks {batch_span[0]}-{batch_span[-1]} in a single paranoia pass...")
+                batch_files = self._rip_track_batch(batch_cmd, batch_span[0], batch_span[-1], output_dir, timeout=1800 * len(batch_span))
+                if self._check_cancelled():
+                    return False
+            
             for i, track in enumerate(tracks, 1):
                 self.current_track = i
-                # Progress: 50% for ripping, 50% for encoding per track
-                base_progress = int((i - 1) / len(tracks) * 100)
+                # Progress: ripping fills the first half of each track's share, its
+                # post-rip job the second half (see _update_post_rip_progress)
+                rip_span = (self.progress, self.progress + int(50 / track_count))
 
-                # Robustly get track title, fallback if missing, and log if metadata is missing
-                fallback_title = f'Track {i:02d}'
-                track_meta = None
-                track_title = None
-                if metadata and metadata.get('tracks') and i <= len(metadata['tracks']):
-                    track_meta = metadata['tracks'][i-1]
-                    if not track_meta:
-                        self.logger.warning(f"No metadata for track {i}, using fallback title '{fallback_title}'")
-                        track_title = fallback_title
-                    else:
-                        title = track_meta.get('title')
-                        if not title or not str(title).strip():
-                            self.logger.warning(f"Missing or empty title for track {i}, using fallback title '{fallback_title}'")
-                            track_title = fallback_title
-                        else:
-                            track_title = str(title)
-                else:
-                    self.logger.warning(f"No metadata entry for track {i}, using fallback title '{fallback_title}'")
-                    track_title = fallback_title
-
-                sanitized_title = self._sanitize_filename(track_title)
+                sanitized_title = self._sanitize_filename(track_titles[i - 1])
                 expected_flac_file = output_dir / f"{i:02d} - {sanitized_title}.flac"
 
                 if expected_flac_file.exists():
                     self.logger.info(f"Track {i} FLAC already exists from burst mode, skipping paranoia re-rip")
                     # Update progress as if we processed this track
-                    self.progress = int(i / len(tracks) * 100)
+                    skipped += 1
+                    self._update_post_rip_progress(finishing, track_count, skipped)
                     continue
 
                 # Use full metadata-based filename for output WAV, matching burst mode
-                fallback_title = f'Track {i:02d}'
-                track_meta = None
-                track_title = None
-                if metadata and metadata.get('tracks') and i <= len(metadata['tracks']):
-                    track_meta = metadata['tracks'][i-1]
-                    if not track_meta:
-                        self.logger.warning(f"No metadata for track {i}, using fallback title '{fallback_title}'")
-                        track_title = fallback_title
-                    else:
-                        title = track_meta.get('title')
-                        if not title or not str(title).strip():
-                            self.logger.warning(f"Missing or empty title for track {i}, using fallback title '{fallback_title}'")
-                            track_title = fallback_title
-                        else:
-                            track_title = str(title)
-                else:
-                    self.logger.warning(f"No metadata entry for track {i}, using fallback title '{fallback_title}'")
-                    track_title = fallback_title
-
-                sanitized_title = self._sanitize_filename(track_title)
                 track_file = output_dir / f"{i:02d} - {sanitized_title}.wav"
 
-                # Use cd-paranoia in paranoia mode
-                cmd = [
-                    'cd-paranoia',
-                    '-d', device,
-                    '-z',  # Never ask, never tell
-                ]
-                # Add offset to cmd if needed (before positional args)
-                if self.config['cd_drive']['offset'] != 0:
-                    cmd.extend(['-O', str(self.config['cd_drive']['offset'])])
+                cmd = base_cmd.copy()
                 # Special handling for last track in paranoia mode
-                if i == len(tracks):
-                    if self.config['cd_drive'].get('force_overread', True):
+                if i == track_count:
+                    if force_overread:
                         cmd.append('--force-overread')
                         self.logger.info(f"Drive supports overread: enabling --force-overread for last track.")
                     # Use minimal paranoia for last track to avoid lead-out issues
@@ -682,9 +1101,26 @@ class CDRipper:
                     self.logger.info(f"Using minimal paranoia mode for last track {i}")
                 cmd.extend([f'{i}', str(track_file)])
 
-                self.logger.info(f"Ripping track {i} in paranoia mode...")
-                self.progress = base_progress
-                result = self._run_cancellable_subprocess(cmd, timeout=1800)
+                # Stop early if an earlier track failed to encode
+                if self._post_rip_failed(finishing):
+                    return False
+
+                encoded = False
+                streamed_checksums = None
+                if i in batch_files:
+                    batch_files[i].replace(track_file)
+                    self.logger.info(f"Track {i} was ripped in the paranoia pass")
+                    result = subprocess.CompletedProcess(batch_cmd, 0, '', '')
+                elif stream_to_flac:
+                    self.logger.info(f"Ripping track {i} in paranoia mode straight to FLAC...")
+                    checksum = AccurateRipAccumulator(self.accuraterip_checker, i, track_count) if use_accuraterip and self._ar_responses else None
+                    result = self._rip_track_to_flac(cmd[:-2], i, output_dir, metadata, timeout=1800, progress_span=rip_span, checksum=checksum)
+                    encoded = result.returncode == 0
+                    if encoded and checksum:
+                        streamed_checksums = checksum.checksums()
+                else:
+                    self.logger.info(f"Ripping track {i} in paranoia mode...")
+                    result = self._run_cancellable_subprocess(cmd, timeout=1800, progress_span=rip_span, capture_stdout=False)
 
                 # Check for cancellation after ripping each track
                 if self._check_cancelled():
@@ -692,7 +1128,7 @@ class CDRipper:
 
                 if result.returncode != 0:
                     # Special last track handling in paranoia mode
-                    if i == len(tracks):
+                    if i == track_count:
                         self.logger.warning(f"Last track failed in paranoia mode: {result.stderr}")
                         # Try one final desperate attempt with absolute minimal settings
                         if '--force-overread' not in cmd:
@@ -703,11 +1139,18 @@ class CDRipper:
                                 '-z',  # Never ask, never tell
                                 '-Y',  # Most lenient
                                 '--force-overread',
-                            ]
-                            if self.config['cd_drive']['offset'] != 0:
-                                emergency_cmd.extend(['-O', str(self.config['cd_drive']['offset'])])
+                            ] + offset_args
                             emergency_cmd += ['-n', '1', f'{i}', str(track_file)]
-                            emergency_result = self._run_cancellable_subprocess(emergency_cmd, timeout=1200)
+                            if stream_to_flac:
+                                # Recover through the flac pipe too; no WAV is written for the last track
+                                checksum = AccurateRipAccumulator(self.accuraterip_checker, i, track_count) if use_accuraterip and self._ar_responses else None
+                                emergency_result = self._rip_track_to_flac(emergency_cmd[:-2], i, output_dir, metadata, timeout=1200,
+                                                                           progress_span=rip_span, checksum=checksum)
+                                encoded = emergency_result.returncode == 0
+                                if encoded and checksum:
+                                    streamed_checksums = checksum.checksums()
+                            else:
+                                emergency_result = self._run_cancellable_subprocess(emergency_cmd, timeout=1200, progress_span=rip_span, capture_stdout=False)
 
                             if emergency_result.returncode == 0:
                                 self.logger.info("Emergency last track recovery successful!")
@@ -720,40 +1163,13 @@ class CDRipper:
                         self.logger.error(f"Failed to rip track {i}: {result.stderr}")
                         return False
 
-                self.logger.info(f"Ripped track {i} in paranoia mode, now encoding to FLAC...")
-
-                # Immediately encode this track to FLAC
-                self.progress = base_progress + int(25 / len(tracks))  # 25% for encoding
-                if not self._encode_single_track(i, track, track_file, output_dir, metadata):
-                    return False
-
-                # Check for cancellation after encoding
-                if self._check_cancelled():
-                    return False
-
-                # Immediately verify with AccurateRip if enabled
-                track_verified = True
-                if self.config['ripping']['use_accuraterip']:
-                    self.logger.info(f"Verifying track {i} with AccurateRip...")
-                    self.progress = base_progress + int(40 / len(tracks))  # +15% for verification
-                    track_verified = self._verify_single_track_accuraterip(i, track_file, disc_info)
-
-                # Check for cancellation after verification
-                if self._check_cancelled():
-                    return False
-
-                # Delete the WAV file to save space (we have the FLAC now)
-                if track_file.exists():
-                    track_file.unlink()
-
-                # Log completion status
-                verification_status = "verified" if track_verified else "verification failed"
-                self.logger.info(f"Completed track {i} (ripped, encoded, {verification_status})")
+                # Encode and verify this track in the background while the next one rips
+                future = post_rip.submit(self._finish_track, i, track, track_file, output_dir, metadata,
+                                         disc_info, encoded, streamed_checksums)
+                finishing.append(future)
+                future.add_done_callback(lambda _: self._update_post_rip_progress(finishing, track_count, skipped))
 
-                # Update progress to completed for this track
-                self.progress = int(i / len(tracks) * 100)
-
-            return True
+            return all(future.result() for future in finishing)
 
         except subprocess.TimeoutExpired:
             self.logger.error("Paranoia mode ripping timed out")
@@ -761,6 +1177,9 @@ class CDRipper:
         except Exception as e:
             self.logger.error(f"Paranoia mode ripping failed: {e}")
             return False
+        finally:
+            # Drop queued work on an early return; running encodes finish (or see the cancel)
+            post_rip.shutdown(cancel_futures=True)
     
     def _verify_accuraterip(self, output_dir: Path) -> bool:
         """Verify rip against AccurateRip database (legacy method)"""
@@ -770,200 +1189,73 @@ class CDRipper:
             self.logger.error(f"AccurateRip verification failed: {e}")
             return False
     
-    def _verify_accuraterip_per_track(self, output_dir: Path, disc_info) -> List[int]:
-        """Verify each track against AccurateRip v1/v2 and return list of failed track numbers"""
+    def _accuraterip_track_offsets(self, disc_info) -> List[int]:
+        """Track start sectors followed by the leadout sector, as AccurateRip's disc IDs expect"""
+        # Track offsets should be in CD sectors/frames
+        track_offsets = [track.start_sector for track in disc_info.tracks]
+        
+        # Add leadout position (end of last track)
+        if disc_info.tracks:
+            last_track = disc_info.tracks[-1]
+            track_offsets.append(last_track.start_sector + last_track.length_sectors)
+        
+        return track_offsets
+    
+    def _lookup_accuraterip(self, disc_info) -> Optional[List[Dict]]:
+        """Fetch the AccurateRip database entries for this disc; None if it has none"""
         try:
-            failed_tracks = []
-            wav_files = sorted(list(output_dir.glob("*.wav")))
-            
-            if not wav_files:
-                self.logger.warning("No WAV files found for AccurateRip verification")
-                return list(range(1, len(disc_info.tracks) + 1))  # All tracks failed
-            
-            # Calculate checksums for all tracks (both v1 and v2)
-            track_checksums = {}
-            for wav_file in wav_files:
-                # Extract track number from filename (e.g., "01.wav" -> 1)
-                track_match = re.search(r'(\d+)\.wav$', wav_file.name)
-                if track_match:
-                    track_num = int(track_match.group(1))
-                    
-                    # Calculate both v1 and v2 checksums
-                    try:
-                        with open(wav_file, 'rb') as f:
-                            header = f.read(44)
-                            if header.startswith(b'RIFF') and b'WAVE' in header:
-                                audio_data = f.read()
-                                v1_checksum = self.accuraterip_checker._calculate_accuraterip_v1_checksum(audio_data)
-                                v2_checksum = self.accuraterip_checker._calculate_accuraterip_v2_checksum(audio_data)
-                                
-                                track_checksums[track_num] = {
-                                    'v1': v1_checksum,
-                                    'v2': v2_checksum
-                                }
-                                
-                                self.logger.debug(f"Track {track_num} checksums: v1={v1_checksum:08X}, v2={v2_checksum:08X}")
-                            else:
-                                self.logger.error(f"Invalid WAV file: {wav_file}")
-                                failed_tracks.append(track_num)
-                    
-                    except Exception as e:
-                        self.logger.error(f"Failed to calculate checksums for track {track_num}: {e}")
-                        failed_tracks.append(track_num)
-            
-            # Verify against AccurateRip database with both versions
-            if track_checksums:
-                verification_results = self.accuraterip_checker.verify_track_checksums_with_versions(
-                    disc_info, track_checksums
-                )
-                
-                # Check which tracks failed based on configuration preferences
-                for track_num in track_checksums.keys():
-                    if track_num in verification_results:
-                        v1_match = verification_results[track_num].get('v1', False)
-                        v2_match = verification_results[track_num].get('v2', False)
-                        
-                        # Apply configuration preferences for AccurateRip verification
-                        prefer_v2 = self.config['ripping'].get('accuraterip_prefer_v2', True)
-                        require_both = self.config['ripping'].get('accuraterip_require_both', False)
-                        
-                        track_passed = False
-                        if require_both:
-                            # Strictest mode: both v1 and v2 must match
-                            track_passed = v1_match and v2_match
-                            match_type = "v1+v2" if track_passed else "neither"
-                        elif prefer_v2:
-                            # Prefer v2, but accept v1 if v2 not available
-                            track_passed = v2_match or v1_match
-                            if v2_match and v1_match:
-                                match_type = "v1+v2"
-                            elif v2_match:
-                                match_type = "v2"
-                            elif v1_match:
-                                match_type = "v1"
-                            else:
-                                match_type = "none"
-                        else:
-                            # Accept either v1 or v2
-                            track_passed = v1_match or v2_match
-                            if v1_match and v2_match:
-                                match_type = "v1+v2"
-                            elif v1_match:
-                                match_type = "v1"
-                            elif v2_match:
-                                match_type = "v2"
-                            else:
-                                match_type = "none"
-                        
-                        if track_passed:
-                            self.logger.info(f"Track {track_num}: AccurateRip ✅ ({match_type})")
-                        else:
-                            self.logger.warning(f"Track {track_num}: AccurateRip ❌ ({match_type})")
-                            failed_tracks.append(track_num)
-                    else:
-                        self.logger.warning(f"Track {track_num}: AccurateRip verification failed")
-                        failed_tracks.append(track_num)
-            else:
-                self.logger.warning("No track checksums calculated for AccurateRip verification")
-                failed_tracks = list(range(1, len(disc_info.tracks) + 1))
-            
-            return sorted(failed_tracks)
-            
+            disc_id1, disc_id2, cddb_id = self.accuraterip_checker.calculate_accuraterip_disc_ids(
+                self._accuraterip_track_offsets(disc_info))
+            responses = self.accuraterip_checker.lookup_accuraterip_database(
+                disc_id1, disc_id2, cddb_id, len(disc_info.tracks))
         except Exception as e:
-            self.logger.error(f"Per-track AccurateRip verification failed: {e}")
-            # Return all tracks as failed if verification fails
-            return list(range(1, len(disc_info.tracks) + 1))
+            self.logger.warning(f"AccurateRip lookup failed: {e}")
+            return None
+        
+        if responses:
+            self.logger.info(f"Found {len(responses)} AccurateRip response(s) for this disc")
+        else:
+            self.logger.info("Disc not in AccurateRip database; per-track checksums will be skipped")
+        return responses or None
     
-    def _rip_failed_tracks_paranoia(self, disc_info, output_dir: Path, failed_tracks: List[int]) -> bool:
-        """Re-rip only the specified tracks using paranoia mode"""
-        device = self.config['cd_drive']['device']
+    def _accuraterip_verdict(self, match: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        Apply the accuraterip_require_both setting to one track's v1/v2 match flags.
         
-        try:
-            self.logger.info(f"Re-ripping {len(failed_tracks)} tracks in paranoia mode: {failed_tracks}")
-            
-            for track_num in failed_tracks:
-                if track_num < 1 or track_num > len(disc_info.tracks):
-                    self.logger.error(f"Invalid track number: {track_num}")
-                    continue
-                
-                # Check for cancellation before each track
-                if self._check_cancelled():
-                    return False
-                
-                self.current_track = track_num
-                # Update progress based on failed tracks
-                progress_index = failed_tracks.index(track_num)
-                self.progress = int(progress_index / len(failed_tracks) * 100)
-                
-                track_file = output_dir / f"{track_num:02d}.wav"
-                
-                # Remove existing file if it exists
-                if track_file.exists():
-                    track_file.unlink()
-                    self.logger.debug(f"Removed existing file: {track_file}")
-                
-                # Use cd-paranoia in paranoia mode for this specific track
-                cmd = [
-                    'cd-paranoia',
-                    '-d', device,
-                    '-z',  # Never ask, never tell
-                    f'{track_num}',
-                    str(track_file)
-                ]
-                
-                # Add sample offset if configured (using -O flag)
-                if self.config['cd_drive']['offset'] != 0:
-                    cmd.extend(['-O', str(self.config['cd_drive']['offset'])])
-                
-                self.logger.info(f"Re-ripping track {track_num} in paranoia mode...")
-                result = self._run_cancellable_subprocess(cmd, timeout=1800)
-                
-                # Check for cancellation after each track
-                if self._check_cancelled():
-                    return False
-                
-                if result.returncode != 0:
-                    self.logger.error(f"Failed to re-rip track {track_num}: {result.stderr}")
-                    return False
-                
-                self.logger.info(f"Successfully re-ripped track {track_num} in paranoia mode")
-                
-                # Optional: Verify the re-ripped track immediately
-                if self.config['ripping'].get('verify_rerip', True):
-                    checksum = self.accuraterip_checker._calculate_accuraterip_checksum(track_file)
-                    if checksum:
-                        self.logger.debug(f"Re-ripped track {track_num} checksum: {checksum:08X}")
-            
-            return True
-            
-        except subprocess.TimeoutExpired:
-            self.logger.error("Paranoia mode re-ripping timed out")
-            return False
-        except Exception as e:
-            self.logger.error(f"Failed to re-rip tracks in paranoia mode: {e}")
-            return False
+        Both versions always come from the same pass over the PCM, so a v1-only
+        database entry still verifies unless both are required. Returns
+        (passed, which versions matched: "v1+v2", "v2", "v1" or "none").
+        """
+        v1_match = match.get('v1', False)
+        v2_match = match.get('v2', False)
+        if v1_match and v2_match:
+            match_type = "v1+v2"
+        elif v2_match:
+            match_type = "v2"
+        elif v1_match:
+            match_type = "v1"
+        else:
+            match_type = "none"
+        
+        if self.config['ripping'].get('accuraterip_require_both', False):
+            # Strictest mode: both v1 and v2 must match
+            return v1_match and v2_match, match_type
+        # Otherwise either version is proof (accuraterip_prefer_v2 only orders the report)
+        return v1_match or v2_match, match_type
     
-    def _finalize_rip(self, disc_info: DiscInfo, metadata: Dict[str, Any], output_dir: Path, skip_encoding: bool = False) -> bool:
-        """Finalize the rip by encoding to FLAC and creating CUE/log"""
+    def _list_wav_files(self, output_dir: Path) -> List[Path]:
+        """Return the WAV files in output_dir, sorted by name, from a single directory scan"""
+        with os.scandir(output_dir) as entries:
+            return sorted(Path(entry.path) for entry in entries if entry.name.endswith('.wav') and entry.is_file())
+    
+    def _finalize_rip(self, disc_info: DiscInfo, metadata: Dict[str, Any], output_dir: Path) -> bool:
+        """Finalize the rip (tracks are already encoded): create the log, verify and clean up"""
         try:
             # Check for cancellation before processing
             if self._check_cancelled():
                 self.logger.info("Finalization cancelled by user")
                 return False
                 
-            # Encode to FLAC (only if not already done per-track)
-            if not skip_encoding:
-                self._update_status(RipStatus.ENCODING)
-                if not self._encode_to_flac(disc_info, metadata, output_dir):
-                    return False
-                
-                # Check for cancellation after encoding
-                if self._check_cancelled():
-                    self.logger.info("Finalization cancelled by user after encoding")
-                    return False
-            else:
-                self.logger.info("Skipping batch encoding (already done per-track)")
-            
             # Create CUE sheet with gap information
             # if self.config['output']['create_cue']:
             #    self._update_status(RipStatus.CREATING_CUE)
@@ -983,29 +1275,22 @@ class CDRipper:
                 self.logger.info("Finalization cancelled by user before cleanup")
                 return False
             
+            # List the WAVs once; verification and cleanup both work from this list
+            wav_files = self._list_wav_files(output_dir)
+            
             # Full AccurateRip verification after all tracks are complete
             if self.config['ripping']['use_accuraterip']:
                 self._update_status(RipStatus.VERIFYING_ACCURATERIP)
                 self.logger.info("Performing final AccurateRip verification...")
                 
                 try:
-                    # Calculate track offsets from disc info
-                    track_offsets = []
-                    for track in disc_info.tracks:
-                        # Track offsets should be in CD sectors/frames
-                        # Convert from MSF format if needed, or use direct sector values
-                        track_offsets.append(track.start_sector)
-                    
-                    # Add leadout position (end of last track + standard gap)
-                    if disc_info.tracks:
-                        last_track = disc_info.tracks[-1]
-                        leadout_sector = last_track.start_sector + last_track.length_sectors
-                        track_offsets.append(leadout_sector)
-                    
+                    track_offsets = self._accuraterip_track_offsets(disc_info)
                     self.logger.info(f"Track offsets for AccurateRip: {track_offsets}")
                     
-                    # Perform full verification
-                    verification_success = self.accuraterip_checker.verify_rip(output_dir, track_offsets)
+                    # Perform full verification, reusing the database entries fetched at the start of the
+                    # rip and the checksums taken per track (the WAVs, if any were written, are gone)
+                    verification_success = self.accuraterip_checker.verify_rip(output_dir, track_offsets, wav_files,
+                                                                               self._ar_responses, self._track_checksums)
                     if verification_success:
                         self.logger.info("🎉 All tracks verified successfully against AccurateRip database!")
                     else:
@@ -1016,11 +1301,10 @@ class CDRipper:
                     # Don't fail the entire rip for AccurateRip issues
             
             # Clean up any remaining WAV files (should be none if per-track encoding worked)
-            remaining_wavs = list(output_dir.glob("*.wav"))
-            if remaining_wavs:
-                self.logger.info(f"Cleaning up {len(remaining_wavs)} remaining WAV files...")
-                for wav_file in remaining_wavs:
-                    wav_file.unlink()
+            if wav_files:
+                self.logger.info(f"Cleaning up {len(wav_files)} remaining WAV files...")
+                for wav_file in wav_files:
+                    os.unlink(wav_file)
             
             self._update_status(RipStatus.COMPLETED)
             elapsed_time = datetime.now() - self.rip_start_time
@@ -1032,130 +1316,52 @@ class CDRipper:
             self.logger.error(f"Failed to finalize rip: {e}")
             return False
     
-    def _encode_to_flac(self, disc_info: DiscInfo, metadata: Dict[str, Any], output_dir: Path) -> bool:
-        """Encode WAV files to FLAC"""
-        tracks = disc_info.tracks
-        track_metadata = metadata.get('tracks', [])
-        
-        for i, track in enumerate(tracks, 1):
-            # Check for cancellation before encoding each track
-            if self._check_cancelled():
-                self.logger.info("Encoding cancelled by user")
-                return False
-                
-            wav_file = output_dir / f"{i:02d}.wav"
-            if not wav_file.exists():
-                self.logger.error(f"WAV file not found: {wav_file}")
-                return False
-            
-            # Get track metadata
-            track_meta = {}
-            if i <= len(track_metadata):
-                track_meta = track_metadata[i-1]
-            
-            flac_file = output_dir / f"{i:02d} - {self._sanitize_filename(track_meta.get('title', f'Track {i:02d}'))}.flac"
-            
-            # Build FLAC encoding command
-            cmd = [
-                'flac',
-                '-f',  # Force overwrite existing files
-                f'--compression-level-{self.config["output"]["compression_level"]}',
-                '--delete-input-file',
-                f'--output-name={flac_file}',
-            ]
-            
-            # Add metadata tags
-            if metadata.get('artist'):
-                cmd.extend(['--tag', f'ARTIST={metadata["artist"]}'])
-            if metadata.get('album'):
-                cmd.extend(['--tag', f'ALBUM={metadata["album"]}'])
-            if metadata.get('date'):
-                cmd.extend(['--tag', f'DATE={metadata["date"]}'])
-            if track_meta.get('title'):
-                cmd.extend(['--tag', f'TITLE={track_meta["title"]}'])
-            if track_meta.get('artist'):
-                cmd.extend(['--tag', f'ARTIST={track_meta["artist"]}'])
-            
-            cmd.extend(['--tag', f'TRACKNUMBER={i}'])
-            cmd.extend(['--tag', f'TOTALTRACKS={len(tracks)}'])
-            cmd.append(str(wav_file))
-            
-            self.logger.info(f"Encoding track {i} to FLAC...")
-            
-            # Calculate dynamic timeout based on track duration
-            # Rule: 3 seconds per minute of audio + 60 second base (very conservative)
-            track_duration_str = track.get('duration', '4:00')  # Default to 4 minutes if unknown
-            try:
-                if ':' in track_duration_str:
-                    parts = track_duration_str.split(':')
-                    track_minutes = int(parts[0]) + float(parts[1]) / 60
-                else:
-                    track_minutes = 4.0  # Fallback
-                encoding_timeout = max(120, int(track_minutes * 3 + 60))  # Min 2 minutes, scale with length
-            except (ValueError, IndexError):
-                encoding_timeout = 300  # Fallback for parsing errors
-            
-            self.logger.debug(f"Using {encoding_timeout}s timeout for {track_duration_str} track")
-            
-            # Use cancellable subprocess for FLAC encoding
-            result = self._run_cancellable_subprocess(cmd, timeout=encoding_timeout)
-            
-            # Check for cancellation after encoding
-            if self._check_cancelled():
-                self.logger.info("Encoding cancelled by user")
-                return False
-            
-            if result.returncode != 0:
-                self.logger.error(f"Failed to encode track {i} to FLAC: {result.stderr}")
-                return False
-            
-            self.progress = int(i / len(tracks) * 100)
-            self.logger.info(f"Encoded track {i} to FLAC")
-        
-        return True
-    
     def _create_log_file(self, toc_info: DiscInfo, metadata: Dict[str, Any], output_dir: Path):
         """Create rip log file"""
-        log_content = [
-            "Rip and Tear Log File",
-            "=" * 50,
-            f"Rip Date: {self.rip_start_time.strftime('%Y-%m-%d %H:%M:%S')}",
-            f"Drive: {self.config['cd_drive']['device']}",
-            f"Drive Offset: {self.config['cd_drive']['offset']} samples",
-            "",
-            "Album Information:",
-            f"  Artist: {metadata.get('artist', 'Unknown')}",
-            f"  Album: {metadata.get('album', 'Unknown')}",
-            f"  Date: {metadata.get('date', 'Unknown')}",
-            f"  Tracks: {len(toc_info.tracks)}",
-            "",
-            "Track Information:",
-        ]
-        
-        for i, track in enumerate(toc_info.tracks, 1):
-            track_meta = metadata.get('tracks', [])
-            title = 'Unknown'
-            if i <= len(track_meta):
-                title = track_meta[i-1].get('title', 'Unknown')
-            
-            log_content.append(f"  {i:02d}. {title} ({track.length_seconds:.2f} seconds)")
-        
-        total_time = sum(track.length_seconds for track in toc_info.tracks)
-        log_content.extend([
-            "",
-            f"Total Time: {total_time:.2f} seconds",
-            f"Rip Mode: {'Burst + AccurateRip' if self.config['ripping']['try_burst_first'] else 'Paranoia'}",
-            f"Encoding: FLAC Level {self.config['output']['compression_level']}",
-        ])
-        
         log_file = output_dir / "rip.log"
-        with open(log_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(log_content))
+        with open(log_file, 'w', encoding='utf-8', buffering=8192) as f:
+            # Written line by line straight into the file buffer; no intermediate list or join
+            w = f.write
+            w("Rip and Tear Log File\n")
+            w("=" * 50 + "\n")
+            w(f"Rip Date: {self.rip_start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            w(f"Drive: {self.config['cd_drive']['device']}\n")
+            w(f"Drive Offset: {self.config['cd_drive']['offset']} samples\n")
+            w("\n")
+            w("Album Information:\n")
+            w(f"  Artist: {metadata.get('artist', 'Unknown')}\n")
+            w(f"  Album: {metadata.get('album', 'Unknown')}\n")
+            w(f"  Date: {metadata.get('date', 'Unknown')}\n")
+            w(f"  Tracks: {len(toc_info.tracks)}\n")
+            w("\n")
+            w("Track Information:\n")
+            
+            # Pair TOC entries with their metadata once; tracks without metadata get {}
+            total_time = 0.0
+            track_pairs = zip(toc_info.tracks, chain(metadata.get('tracks', []), repeat({})))
+            for i, (track, track_meta) in enumerate(track_pairs, 1):
+                title = track_meta.get('title', 'Unknown')
+                
+                w(f"  {i:02d}. {title} ({track.length_seconds:.2f} seconds)\n")
+                total_time += track.length_seconds
+            
+            w("\n")
+            w(f"Total Time: {total_time:.2f} seconds\n")
+            w(f"Rip Mode: {'Burst + AccurateRip' if self.config['ripping']['try_burst_first'] else 'Paranoia'}\n")
+            w(f"Encoding: FLAC Level {self.config['output']['compression_level']}")
+            if self._ar_failed_tracks:
+                w(f"\nAccurateRip: no match for track(s) {', '.join(map(str, sorted(self._ar_failed_tracks)))} (kept)\n")
     
     def _update_status(self, status: str, error_msg: str = ""):
-        """Update ripping status"""
+        """Update ripping status; returning to IDLE also clears the per-rip progress fields"""
         self.status = status
         self.error_message = error_msg
+        if status == RipStatus.IDLE:
+            self.progress = 0
+            self.current_track = 0
+            self.total_tracks = 0
+            self.rip_start_time = None
+            self._rip_start_iso = None
         if error_msg:
             self.logger.error(error_msg)
     
@@ -1163,14 +1369,15 @@ class CDRipper:
         """Check if a CD is present in the drive"""
         try:
             # Try to read the CD table of contents
+            # Only stderr is inspected, and only for a substring, so skip stdout and decoding
             result = subprocess.run(
-                ['cd-paranoia', '-Q', '-d', self.device],
-                capture_output=True,
-                text=True,
+                ['cd-paranoia', '-Q', '-d', self.config['cd_drive']['device']],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=10
             )
             # If cd-paranoia can read the TOC, a CD is present
-            return result.returncode == 0 and 'track' in result.stderr.lower()
+            return result.returncode == 0 and b'track' in result.stderr.lower()
         except subprocess.TimeoutExpired:
             return False
         except FileNotFoundError:
@@ -1184,20 +1391,16 @@ class CDRipper:
         """Get current ripping status"""
         # If we're actively working with the CD, assume it's present to avoid conflicts
         # with cd-paranoia processes already accessing the drive
-        active_states = [
-            RipStatus.READING_TOC,
-            RipStatus.FETCHING_METADATA,
-            RipStatus.RIPPING_BURST,
-            RipStatus.VERIFYING_ACCURATERIP,
-            RipStatus.RERIPPING_FAILED_TRACKS,
-            RipStatus.RIPPING_PARANOIA,
-            RipStatus.ENCODING
-        ]
-        
-        if self.status in active_states:
+        if self.status in _ACTIVE_STATES:
             cd_present = True
         else:
-            cd_present = self._check_cd_present()
+            # Web polling calls this several times a second; probe the drive at most
+            # once per CD_PRESENT_CACHE_SECONDS
+            now = time.monotonic()
+            checked_at, cd_present = self._cd_present_cache
+            if now - checked_at > CD_PRESENT_CACHE_SECONDS:
+                cd_present = self._check_cd_present()
+                self._cd_present_cache = (now, cd_present)
         
         return {
             'status': self.status,
@@ -1205,10 +1408,15 @@ class CDRipper:
             'current_track': self.current_track,
             'total_tracks': self.total_tracks,
             'error_message': self.error_message,
-            'start_time': self.rip_start_time.isoformat() if self.rip_start_time else None,
-            'cd_present': cd_present
+            'start_time': self._rip_start_iso,
+            'cd_present': cd_present,
+            'accuraterip_failed_tracks': sorted(self._ar_failed_tracks)
         }
     
+    def is_ripping(self) -> bool:
+        """Whether a rip is in progress (not idle, completed or failed)"""
+        return self.status in _ACTIVE_STATES
+    
     def cancel_rip(self) -> bool:
         """Cancel the current ripping operation"""
         try:
@@ -1217,31 +1425,43 @@ class CDRipper:
                 return False
             
             self.logger.info("Cancel requested - attempting to stop current operation")
-            self.cancel_requested = True
+            self._cancel_token.cancel()
             
-            # Try to terminate any running subprocess
-            if self.current_process and self.current_process.poll() is None:
-                self.logger.info("Terminating current subprocess")
+            # Terminate every running subprocess (and everything it started), not just
+            # cd-paranoia: later pipeline stages and parallel flac encoders too
+            process = self.current_process
+            running = [p for p in list(self._live_processes) if p.poll() is None]
+            if running:
+                self.logger.info(f"Terminating {len(running)} running subprocess(es)")
                 try:
-                    self.current_process.terminate()
-                    # Give it a moment to terminate gracefully
-                    try:
-                        self.current_process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        # Force kill if it doesn't terminate
-                        self.current_process.kill()
-                        self.current_process.wait()
-                    self.logger.info("Subprocess terminated successfully")
-                except Exception as e:
-                    self.logger.error(f"Error terminating subprocess: {e}")
+                    for p in running:
+                        self._signal_process_group(p, signal.SIGTERM)
+                    # Give them a moment (shared, not per process) to terminate gracefully
+                    deadline = time.monotonic() + 5
+                    stuck = [p for p in running
+                             if not self._wait_for_exit(p, max(0.0, deadline - time.monotonic()))]
+                    if not stuck:
+                        self.logger.info("Subprocesses terminated successfully")
+                    else:
+                        # Force kill the ones that didn't terminate
+                        for p in stuck:
+                            self._signal_process_group(p, signal.SIGKILL)
+                        for p in stuck:
+                            if self._wait_for_exit(p, 1):
+                                self.logger.info(f"Subprocess {p.pid} killed")
+                            else:
+                                # Stuck in uninterruptible I/O; the rip thread that started it
+                                # reaps it once the kernel lets it go
+                                self.logger.error(f"Subprocess {p.pid} did not exit after SIGKILL; detaching")
+                except (OSError, subprocess.SubprocessError) as e:
+                    self.logger.error(f"Error terminating subprocesses: {e}")
             
             # Update status
             self._update_status(RipStatus.IDLE, "Operation cancelled by user")
-            self.progress = 0
-            self.current_track = 0
-            self.total_tracks = 0
-            self.rip_start_time = None
-            self.current_process = None
+            # The rip thread may have started its next subprocess meanwhile; leave that one
+            # visible (the cancelled token stops it) and let the pipeline clear its own entry
+            if self.current_process is process:
+                self.current_process = None
             
             return True
             
@@ -1249,50 +1469,292 @@ class CDRipper:
             self.logger.error(f"Error during cancellation: {e}")
             return False
     
+    def _signal_process_group(self, process: subprocess.Popen, sig: int):
+        """Send sig to the process group a subprocess leads (started with start_new_session=True)"""
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            pass  # Already gone
+    
+    def _wait_for_exit(self, process: subprocess.Popen, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds for process to exit; True if it did.
+        
+        On Linux a pidfd wakes us the moment the child exits, instead of Popen.wait's
+        sleep-and-poll loop. The child is left for the thread that started it to reap.
+        """
+        if hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(process.pid)
+            except ProcessLookupError:
+                return True  # Already exited and reaped
+            except OSError:
+                pass  # Kernel older than 5.3; fall back to polling
+            else:
+                try:
+                    readable, _, _ = select.select([pidfd], [], [], timeout)
+                    return bool(readable)
+                finally:
+                    os.close(pidfd)
+        try:
+            process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+    
+    def _begin_rip(self):
+        """
+        Reset per-rip state at the start of rip_cd.
+        
+        This is the only place a previous cancel request is dropped; _check_cancelled
+        never clears it, so every task polling the token sees the same answer.
+        """
+        self.rip_start_time = datetime.now()
+        self._rip_start_iso = self.rip_start_time.isoformat()
+        self.progress = 0  # Only moves forward within a rip (see _update_post_rip_progress)
+        self._cancel_token = CancellationToken()
+        self._ar_responses = None
+        self._ar_table = {}
+        self._track_checksums = {}
+        self._ar_failed_tracks = set()
+    
     def _check_cancelled(self) -> bool:
-        """Check if cancellation has been requested"""
-        if self.cancel_requested:
+        """
+        Check if cancellation has been requested.
+        
+        The root token stays cancelled until the next rip starts, so every phase that
+        checks it unwinds instead of only the first one.
+        """
+        if self._cancel_token.is_cancelled():
             self.logger.info("Operation cancelled - aborting current task")
-            self.cancel_requested = False  # Reset flag
             return True
         return False
     
-    def _run_cancellable_subprocess(self, cmd, timeout=600, **kwargs):
-        """Run a subprocess that can be cancelled"""
+    def _run_cancellable_subprocess(self, cmd, timeout=600, progress_span: Optional[Tuple[int, int]] = None, **kwargs):
+        """
+        Run a subprocess that can be cancelled.
+        
+        stdout and stderr are drained as the process writes them rather than buffered
+        until exit, so only the tail of stderr is kept; a cancel wakes the wait
+        immediately (see _run_cancellable_pipeline). If progress_span=(start, end) is given, cd-paranoia's sector
+        progress is mapped onto self.progress within that range.
+        """
+        return self._run_cancellable_pipeline([cmd], timeout=timeout, progress_span=progress_span, **kwargs)
+    
+    def _run_cancellable_pipeline(self, cmds: List[List[str]], timeout=600, progress_span: Optional[Tuple[int, int]] = None,
+                                  relay: Optional[Callable[[bytes], None]] = None,
+                                  relay_paused: Optional[Callable[[], bool]] = None,
+                                  cancel_token: Optional[CancellationToken] = None, capture_stdout: bool = True, **kwargs):
+        """
+        Run commands chained stdout -> stdin like a shell pipeline, with the same
+        cancellation, timeout and progress handling as _run_cancellable_subprocess.
+        
+        If relay is given, the data between the first and second stage is copied
+        through this process instead of a kernel pipe and relay(chunk) sees every
+        chunk on the way (used to checksum PCM while it is being encoded). With a
+        single command, relay receives its stdout instead of it being captured; while
+        relay_paused() is true that stdout is left unread (so a consumer that queues the
+        chunks stays bounded), re-checked every RELAY_PAUSE_POLL seconds.
+        
+        The returncode is that of the first stage that failed (0 if all succeeded);
+        stderr holds the tails of every stage. progress_span applies to the first stage.
+        cancel_token defaults to the rip's root token. Callers that only need the
+        returncode pass capture_stdout=False to send the last stage's stdout to /dev/null.
+        """
+        if cancel_token is None:
+            cancel_token = self._cancel_token
+        processes = []
         try:
-            # Start the process
-            self.current_process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, **kwargs)
+            # Start the processes; each stage reads the previous stage's stdout directly
+            last = len(cmds) - 1
+            for position, cmd in enumerate(cmds):
+                if not processes:
+                    stdin = kwargs.pop('stdin', None)
+                elif relay and len(processes) == 1:
+                    stdin = subprocess.PIPE
+                else:
+                    stdin = processes[-1].stdout
+                # Each stage gets its own process group so cancellation reaches its children too
+                stdout = subprocess.PIPE if capture_stdout or position < last else subprocess.DEVNULL
+                processes.append(subprocess.Popen(cmd, stdin=stdin, stdout=stdout, stderr=subprocess.PIPE,
+                                                  executable=_resolve_executable(cmd[0]),
+                                                  start_new_session=True, **kwargs))
+                self._live_processes.add(processes[-1])
+                if stdin is not None and stdin is not subprocess.PIPE and len(processes) > 1:
+                    # Only the next stage reads this pipe, so it sees EOF/SIGPIPE correctly
+                    stdin.close()
+            self.current_process = processes[0]
+            
+            streams = {processes[-1].stdout.fileno(): None} if capture_stdout else {}
+            # A lone stage's stdout goes to relay; otherwise it is the pipeline's captured output
+            take_stdout = relay if relay and len(processes) == 1 else None
+            for index, process in enumerate(processes):
+                streams[process.stderr.fileno()] = index
+            relay_out = None
+            if relay and len(processes) > 1:
+                streams[processes[0].stdout.fileno()] = 'relay'
+                relay_out = processes[1].stdin
+                os.set_blocking(relay_out.fileno(), False)
+            for fd in streams:
+                os.set_blocking(fd, False)
+            
+            stdout_chunks = []
+            if take_stdout is None:
+                take_stdout = stdout_chunks.append
+            stderr_tails = [deque(maxlen=STDERR_TAIL_LINES) for _ in processes]
+            pending_lines = {fd: b'' for fd, index in streams.items() if isinstance(index, int)}
+            relay_buffer = bytearray()
+            relay_eof = False
+            sector_range = [None, None]
+            deadline = time.monotonic() + timeout
+            terminated = False
+            # Bound once; these run for every chunk/line a subprocess writes
+            read = os.read
+            split_lines = _STDERR_LINE_SPLIT_RE.split
+            update_progress = self._update_paranoia_progress if progress_span else None
+            
+            # epoll/kqueue-backed selector: no FD_SETSIZE limit in a long-running server
+            selector = selectors.DefaultSelector()
+            watched = {}
+            # Cancelling writes to this socket, so the loop can block until output, a
+            # cancel or the deadline instead of waking every 100 ms to poll the token
+            wake_reader, wake_writer = socket.socketpair()
+            wake_reader.setblocking(False)
+            selector.register(wake_reader, selectors.EVENT_READ)
+            
+            def wake():
+                try:
+                    wake_writer.send(b'\0')
+                except OSError:
+                    pass  # Already woken (buffer full) or the loop has finished
+            
+            cancel_token.add_waker(wake)
+            
+            def watch(fd, events):
+                """Bring the selector registration of fd in line with the wanted events"""
+                current = watched.get(fd, 0)
+                if events == current:
+                    return
+                if not events:
+                    selector.unregister(fd)
+                    del watched[fd]
+                elif current:
+                    selector.modify(fd, events)
+                    watched[fd] = events
+                else:
+                    selector.register(fd, events)
+                    watched[fd] = events
             
-            # Wait for completion or cancellation
             try:
-                stdout, stderr = self.current_process.communicate(timeout=timeout)
-                returncode = self.current_process.returncode
-                self.current_process = None
-                
-                # Create a result object similar to subprocess.run
-                class ProcessResult:
-                    def __init__(self, returncode, stdout, stderr):
-                        self.returncode = returncode
-                        self.stdout = stdout
-                        self.stderr = stderr
-                
-                return ProcessResult(returncode, stdout, stderr)
-                
-            except subprocess.TimeoutExpired:
-                # Process timed out
-                if self.current_process:
-                    self.current_process.kill()
-                    self.current_process.wait()
-                    self.current_process = None
-                raise
+                # Wait for completion or cancellation
+                while streams or relay_out:
+                    if not terminated and cancel_token.is_cancelled():
+                        self.logger.info("Cancel requested - terminating subprocess")
+                        for process in processes:
+                            if process.poll() is None:
+                                self._signal_process_group(process, signal.SIGTERM)
+                        terminated = True
+                    
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        # Process timed out; killed by the cleanup below
+                        raise subprocess.TimeoutExpired(cmds[0], timeout)
+                    
+                    # Stop reading the first stage while the encoder is behind, so the relay buffer stays bounded
+                    relay_held = take_stdout is relay and relay_paused is not None and relay_paused()
+                    for fd, index in streams.items():
+                        if index == 'relay':
+                            wanted = len(relay_buffer) < RELAY_BUFFER_LIMIT
+                        else:
+                            wanted = index is not None or not relay_held
+                        watch(fd, selectors.EVENT_READ if wanted else 0)
+                    if relay_out:
+                        watch(relay_out.fileno(), selectors.EVENT_WRITE if relay_buffer else 0)
+                    
+                    for key, mask in selector.select(timeout=min(remaining, RELAY_PAUSE_POLL) if relay_held else remaining):
+                        fd = key.fd
+                        if key.fileobj is wake_reader:
+                            wake_reader.recv(64)  # The cancel itself is seen at the top of the loop
+                            continue
+                        if mask & selectors.EVENT_WRITE:
+                            try:
+                                written = os.write(fd, relay_buffer[:65536])
+                                del relay_buffer[:written]
+                            except BrokenPipeError:
+                                # The second stage exited; its returncode reports the failure
+                                relay_buffer.clear()
+                                relay_eof = True
+                            continue
+                        
+                        chunk = read(fd, 65536)
+                        index = streams[fd]
+                        if not chunk:
+                            watch(fd, 0)
+                            del streams[fd]
+                            if index == 'relay':
+                                relay_eof = True
+                            elif index is not None and pending_lines[fd]:
+                                stderr_tails[index].append(pending_lines[fd])
+                        elif index is None:
+                            take_stdout(chunk)
+                        elif index == 'relay':
+                            relay(chunk)
+                            if not relay_eof:
+                                relay_buffer += chunk
+                        else:
+                            lines = split_lines(pending_lines[fd] + chunk)
+                            pending_lines[fd] = lines.pop()
+                            tail = stderr_tails[index]
+                            track_progress = update_progress if index == 0 else None
+                            for line in lines:
+                                if line:
+                                    tail.append(line)
+                                    if track_progress:
+                                        track_progress(line, sector_range, progress_span)
+                    
+                    if relay_out and relay_eof and not relay_buffer:
+                        # Everything has been handed over; let the second stage see EOF
+                        watch(relay_out.fileno(), 0)
+                        relay_out.close()
+                        relay_out = None
+            finally:
+                cancel_token.remove_waker(wake)
+                selector.close()
+                wake_reader.close()
+                wake_writer.close()
+            
+            returncodes = [process.wait() for process in processes]
+            returncode = next((code for code in returncodes if code != 0), 0)
+            
+            return ProcessResult(
+                returncode,
+                b''.join(stdout_chunks).decode('utf-8', errors='replace'),
+                b'\n'.join(line for tail in stderr_tails for line in tail).decode('utf-8', errors='replace'),
+            )
                 
-        except Exception as e:
-            # Clean up process reference on any error
-            if self.current_process:
-                try:
-                    self.current_process.kill()
-                    self.current_process.wait()
-                except:
-                    pass
-                self.current_process = None
+        except BaseException:
+            # Clean up processes on any error, including KeyboardInterrupt/SystemExit; always re-raised
+            _kill_process_groups(processes)
             raise
+        
+        finally:
+            # Concurrent encodes share this attribute; only clear it if it still refers to this pipeline
+            if processes and self.current_process is processes[0]:
+                self.current_process = None
+            self._live_processes.difference_update(processes)
+    
+    def _update_paranoia_progress(self, line: bytes, sector_range: List[Optional[int]], progress_span: Tuple[int, int]):
+        """Map a cd-paranoia stderr line onto self.progress within progress_span"""
+        match = _PARANOIA_SECTOR_RE.search(line)
+        if match:
+            index = 0 if match.group(1) == b'from' else 1
+            sector_range[index] = int(match.group(2))
+            return
+        
+        match = _PARANOIA_PROGRESS_RE.search(line)
+        first, last = sector_range
+        if match and first is not None and last is not None and last > first:
+            # The progress bar reports the sector currently being verified
+            fraction = min(max((int(match.group(1)) - first) / (last - first), 0.0), 1.0)
+            start, end = progress_span
+            self.progress = max(self.progress, start + int(fraction * (end - start)))
@@ -4,11 +4,75 @@ Configuration Manager for Rip and Tear
 Handles loading and saving configuration settings
 """
 
+import copy
 import os
 import yaml
 import logging
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    # libyaml-backed loader/dumper; same results as the pure-Python ones, much faster
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+def _str_to_bool(value: str) -> bool:
+    """Convert string to boolean"""
+    return value.lower() in ('true', '1', 'yes', 'on', 'enabled')
+
+# Device nodes tried when the configured CD device does not exist
+POTENTIAL_CD_DEVICES = ('/dev/cdrom', '/dev/sr0', '/dev/sr1', '/dev/cdrom0')
+
+# Environment variable -> (config section, key, converter), built once at import
+ENV_MAPPINGS = {
+    # CD Drive settings
+    'CD_DEVICE': ('cd_drive', 'device', str),
+    'DRIVE_OFFSET': ('cd_drive', 'offset', int),
+    'DRIVE_SPEED': ('cd_drive', 'speed', str),
+    'ENABLE_C2': ('cd_drive', 'enable_c2', _str_to_bool),
+    'TEST_AND_COPY': ('cd_drive', 'test_and_copy', _str_to_bool),
+    
+    # Output settings
+    'OUTPUT_FORMAT': ('output', 'format', str),
+    'COMPRESSION_LEVEL': ('output', 'compression_level', int),
+#    'CREATE_CUE': ('output', 'create_cue', _str_to_bool),
+    'CREATE_LOG': ('output', 'create_log', _str_to_bool),
+    'PRESERVE_HTOA': ('output', 'preserve_htoa', _str_to_bool),
+    'GAP_HANDLING': ('output', 'gap_handling', str),
+    
+    # Ripping settings
+    'TRY_BURST_FIRST': ('ripping', 'try_burst_first', _str_to_bool),
+    'USE_ACCURATERIP': ('ripping', 'use_accuraterip', _str_to_bool),
+    'ACCURATERIP_PREFER_V2': ('ripping', 'accuraterip_prefer_v2', _str_to_bool),
+    'ACCURATERIP_REQUIRE_BOTH': ('ripping', 'accuraterip_require_both', _str_to_bool),
+    'PARANOIA_MODE': ('ripping', 'paranoia_mode', str),
+    'MAX_RETRIES': ('ripping', 'max_retries', int),
+    'LEADOUT_DETECTION': ('ripping', 'leadout_detection', str),
+    'SECTOR_RETRIES': ('ripping', 'sector_retries', int),
+    'ENABLE_GAP_DETECTION': ('ripping', 'enable_gap_detection', _str_to_bool),
+    'READ_LEAD_IN': ('ripping', 'read_lead_in', _str_to_bool),
+    'MULTIPLE_READ_VERIFICATION': ('ripping', 'multiple_read_verification', _str_to_bool),
+    'VERIFY_RERIP': ('ripping', 'verify_rerip', _str_to_bool),
+    'SELECTIVE_RERIP': ('ripping', 'selective_rerip', _str_to_bool),
+    'STREAM_TO_FLAC': ('ripping', 'stream_to_flac', _str_to_bool),
+    
+    # Metadata settings
+    'USE_MUSICBRAINZ': ('metadata', 'use_musicbrainz', _str_to_bool),
+    'MUSICBRAINZ_SERVER': ('metadata', 'musicbrainz_server', str),
+    'USER_AGENT': ('metadata', 'user_agent', str),
+    'CONTACT_EMAIL': ('metadata', 'contact_email', str),
+    
+    # Web GUI settings
+    'WEB_HOST': ('web_gui', 'host', str),
+    'WEB_PORT': ('web_gui', 'port', int),
+    'WEB_DEBUG': ('web_gui', 'debug', _str_to_bool),
+    
+    # Logging settings
+    'LOG_LEVEL': ('logging', 'level', str),
+    'MAX_LOG_FILES': ('logging', 'max_log_files', int),
+    'MAX_LOG_SIZE_MB': ('logging', 'max_log_size_mb', int),
+}
 
 class ConfigManager:
     """Manages application configuration"""
@@ -18,24 +82,39 @@ class ConfigManager:
         self.config_dir = Path(os.getenv('CONFIG_DIR', '/config'))
         self.config_file = self.config_dir / 'config.yaml'
         self.default_config_file = Path(__file__).parent / 'config' / 'default_config.yaml'
+        # ((mtime_ns, size) of config_file, validated config) from the last load
+        self._cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+        # Missing configured CD device -> device get_cd_device auto-detected in its place
+        self._detected_devices: Dict[str, str] = {}
         
     def load_config(self) -> Dict[str, Any]:
-        """Load configuration from file and environment variables"""
+        """
+        Load configuration from file and environment variables.
+        
+        While config.yaml is unchanged the previous result is reused instead of parsing
+        and merging again; callers get their own copy either way.
+        """
         try:
             # Load base configuration from file
             if self.config_file.exists():
+                stat = self.config_file.stat()
+                file_key = (stat.st_mtime_ns, stat.st_size)
+                if self._cache and self._cache[0] == file_key:
+                    return copy.deepcopy(self._cache[1])
                 with open(self.config_file, 'r') as f:
-                    config = yaml.safe_load(f)
+                    config = yaml.load(f, Loader=_YamlLoader)
                 self.logger.info(f"Loaded configuration from {self.config_file}")
             else:
+                file_key = None
                 config = self._load_default_config()
                 self.save_config(config)
                 self.logger.info("Created new configuration from defaults")
             
             # Override with environment variables
-            config = self._apply_environment_overrides(config)
-            
-            return self._validate_config(config)
+            config = self._validate_config(self._apply_environment_overrides(config))
+            if file_key is not None:
+                self._cache = (file_key, copy.deepcopy(config))
+            return config
             
         except Exception as e:
             self.logger.error(f"Error loading configuration: {e}")
@@ -47,7 +126,7 @@ class ConfigManager:
         try:
             self.config_dir.mkdir(exist_ok=True)
             with open(self.config_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False, indent=2)
+                yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
             self.logger.info(f"Saved configuration to {self.config_file}")
         except Exception as e:
             self.logger.error(f"Error saving configuration: {e}")
@@ -76,6 +155,7 @@ class ConfigManager:
                 'paranoia_mode': 'full',  # full, overlap, neverskip
                 'max_retries': 10,
                 'leadout_detection': 'disabled',  # Completely bypass lead-out logic by default
+                'stream_to_flac': True,  # Pipe per-track rips straight into flac, checksumming on the fly
             },
             'metadata': {
                 'use_musicbrainz': True,
@@ -113,101 +193,43 @@ class ConfigManager:
     
     def _apply_environment_overrides(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Apply environment variable overrides to configuration"""
-        env_mappings = {
-            # CD Drive settings
-            'CD_DEVICE': ('cd_drive', 'device'),
-            'DRIVE_OFFSET': ('cd_drive', 'offset', int),
-            'DRIVE_SPEED': ('cd_drive', 'speed'),
-            'ENABLE_C2': ('cd_drive', 'enable_c2', self._str_to_bool),
-            'TEST_AND_COPY': ('cd_drive', 'test_and_copy', self._str_to_bool),
-            
-            # Output settings
-            'OUTPUT_FORMAT': ('output', 'format'),
-            'COMPRESSION_LEVEL': ('output', 'compression_level', int),
-#            'CREATE_CUE': ('output', 'create_cue', self._str_to_bool),
-            'CREATE_LOG': ('output', 'create_log', self._str_to_bool),
-            'PRESERVE_HTOA': ('output', 'preserve_htoa', self._str_to_bool),
-            'GAP_HANDLING': ('output', 'gap_handling'),
-            
-            # Ripping settings
-            'TRY_BURST_FIRST': ('ripping', 'try_burst_first', self._str_to_bool),
-            'USE_ACCURATERIP': ('ripping', 'use_accuraterip', self._str_to_bool),
-            'ACCURATERIP_PREFER_V2': ('ripping', 'accuraterip_prefer_v2', self._str_to_bool),
-            'ACCURATERIP_REQUIRE_BOTH': ('ripping', 'accuraterip_require_both', self._str_to_bool),
-            'PARANOIA_MODE': ('ripping', 'paranoia_mode'),
-            'MAX_RETRIES': ('ripping', 'max_retries', int),
-            'LEADOUT_DETECTION': ('ripping', 'leadout_detection'),
-            'SECTOR_RETRIES': ('ripping', 'sector_retries', int),
-            'ENABLE_GAP_DETECTION': ('ripping', 'enable_gap_detection', self._str_to_bool),
-            'READ_LEAD_IN': ('ripping', 'read_lead_in', self._str_to_bool),
-            'MULTIPLE_READ_VERIFICATION': ('ripping', 'multiple_read_verification', self._str_to_bool),
-            'VERIFY_RERIP': ('ripping', 'verify_rerip', self._str_to_bool),
-            'SELECTIVE_RERIP': ('ripping', 'selective_rerip', self._str_to_bool),
-            
-            # Metadata settings
-            'USE_MUSICBRAINZ': ('metadata', 'use_musicbrainz', self._str_to_bool),
-            'MUSICBRAINZ_SERVER': ('metadata', 'musicbrainz_server'),
-            'USER_AGENT': ('metadata', 'user_agent'),
-            'CONTACT_EMAIL': ('metadata', 'contact_email'),
-            
-            # Web GUI settings
-            'WEB_HOST': ('web_gui', 'host'),
-            'WEB_PORT': ('web_gui', 'port', int),
-            'WEB_DEBUG': ('web_gui', 'debug', self._str_to_bool),
-            
-            # Logging settings
-            'LOG_LEVEL': ('logging', 'level'),
-            'MAX_LOG_FILES': ('logging', 'max_log_files', int),
-            'MAX_LOG_SIZE_MB': ('logging', 'max_log_size_mb', int),
-        }
-        
-        for env_var, mapping in env_mappings.items():
-            env_value = os.getenv(env_var)
-            if env_value is not None:
-                try:
-                    section = mapping[0]
-                    key = mapping[1]
-                    converter = mapping[2] if len(mapping) > 2 else str
-                    
-                    # Ensure section exists
-                    if section not in config:
-                        config[section] = {}
-                    
-                    # Convert and set value
-                    if converter == int:
-                        try:
-                            config[section][key] = int(env_value)
-                        except ValueError:
-                            self.logger.warning(f"Invalid integer value for {env_var}: {env_value}")
-                            continue
-                    elif callable(converter):
-                        config[section][key] = converter(env_value)
-                    else:
-                        config[section][key] = env_value
-                    
-                    self.logger.debug(f"Applied environment override: {env_var}={env_value}")
-                    
-                except Exception as e:
-                    self.logger.warning(f"Failed to apply environment override {env_var}: {e}")
+        # Only look at the variables that are actually set
+        for env_var in ENV_MAPPINGS.keys() & os.environ.keys():
+            env_value = os.environ[env_var]
+            section, key, converter = ENV_MAPPINGS[env_var]
+            try:
+                # Ensure section exists
+                config.setdefault(section, {})[key] = converter(env_value)
+                self.logger.debug(f"Applied environment override: {env_var}={env_value}")
+            except ValueError:
+                self.logger.warning(f"Invalid value for {env_var}: {env_value}")
+            except Exception as e:
+                self.logger.warning(f"Failed to apply environment override {env_var}: {e}")
         
         return config
     
     def _str_to_bool(self, value: str) -> bool:
         """Convert string to boolean"""
-        return value.lower() in ('true', '1', 'yes', 'on', 'enabled')
+        return _str_to_bool(value)
     
     def get_cd_device(self, config: Dict[str, Any]) -> str:
-        """Get CD device path, with auto-detection fallback"""
+        """Get CD device path, with auto-detection fallback (remembered while it exists)"""
         device = config['cd_drive']['device']
+        # The configured device is checked every time, so a drive that comes back is used again
+        if os.path.exists(device):
+            return device
         
-        # Try to auto-detect if default device doesn't exist
-        if not os.path.exists(device):
-            potential_devices = ['/dev/cdrom', '/dev/sr0', '/dev/sr1', '/dev/cdrom0']
-            for dev in potential_devices:
-                if os.path.exists(dev):
-                    self.logger.info(f"Auto-detected CD device: {dev}")
-                    return dev
-            
-            self.logger.warning(f"CD device {device} not found, using anyway")
+        # Reuse an earlier auto-detected device only while it is still there
+        detected = self._detected_devices.get(device)
+        if detected and os.path.exists(detected):
+            return detected
+        self._detected_devices.pop(device, None)
+        
+        for dev in POTENTIAL_CD_DEVICES:
+            if os.path.exists(dev):
+                self.logger.info(f"Auto-detected CD device: {dev}")
+                self._detected_devices[device] = dev
+                return dev
         
+        self.logger.warning(f"CD device {device} not found, using anyway")
         return device
@@ -4,9 +4,31 @@ CUE Generator - Creates CUE sheets for ripped CDs
 """
 
 import logging
+import shutil
 from pathlib import Path
 import subprocess
 
+# Filesystem-unsafe characters and their replacements, applied in a single pass.
+# Public because CDRipper._sanitize_filename uses it too, so CUE/TOC names match the
+# album's FLAC and directory names: any change here renames files in both places.
+# Control characters (NUL included) become spaces, which the whitespace collapse then folds.
+SANITIZE_TABLE = str.maketrans({
+    **{chr(code): ' ' for code in range(0x20)},
+    '\x7f': ' ',
+    '/': '-',
+    '\\': '-',
+    ':': ' -',
+    '*': '',
+    '?': '',
+    '"': "'",
+    '<': '(',
+    '>': ')',
+    '|': '-'
+})
+
+# toc2cue resolved once, instead of a PATH search on every conversion
+_TOC2CUE = shutil.which('toc2cue') or 'toc2cue'
+
 class CueGenerator:
     """Generates CUE sheets for CD rips"""
     
@@ -20,41 +42,32 @@ class CueGenerator:
             cue_file = output_dir / f"{self._sanitize_filename(metadata.get('album', 'Unknown Album'))}.cue"
             toc_file = output_dir / f"{self._sanitize_filename(metadata.get('album', 'Unknown Album'))}.toc"
 
-            # Convert TOC to CUE using toc2cue
-            result = subprocess.run(
-                ['toc2cue', str(toc_file), str(cue_file)],
-                capture_output=True, text=True, timeout=30
-            )
+            # Convert TOC to CUE using toc2cue; its output is only decoded if it failed
+            try:
+                result = subprocess.run(
+                    [_TOC2CUE, str(toc_file), str(cue_file)],
+                    capture_output=True, timeout=30
+                )
+            except subprocess.TimeoutExpired:
+                self.logger.error("toc2cue timed out converting %s", toc_file)
+                raise
 
             if result.returncode != 0:
-                self.logger.error(f"toc2cue failed with return code {result.returncode}")
+                self.logger.error("toc2cue failed with return code %d", result.returncode)
                 if result.stderr:
-                    self.logger.error(f"toc2cue stderr: {result.stderr}")
+                    self.logger.error("toc2cue stderr: %s", result.stderr.decode('utf-8', errors='replace'))
                 raise RuntimeError("Failed to convert TOC to CUE")
 
-            self.logger.info(f"Created CUE sheet: {cue_file}")
+            # Arguments rather than f-strings: logging only formats records it emits
+            self.logger.info("Created CUE sheet: %s", cue_file)
             return cue_file
 
         except Exception as e:
-            self.logger.error(f"Failed to create CUE sheet: {e}")
+            self.logger.error("Failed to create CUE sheet: %s", e)
             raise
     
     
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for filesystem compatibility"""
-        chars_to_replace = {
-            '/': '-',
-            '\\': '-',
-            ':': ' -',
-            '*': '',
-            '?': '',
-            '"': "'",
-            '<': '(',
-            '>': ')',
-            '|': '-'
-        }
-        
-        for char, replacement in chars_to_replace.items():
-            filename = filename.replace(char, replacement)
-        
-        return ' '.join(filename.split()).strip()
+        # Replace problematic characters, then collapse multiple spaces and trim
+        return ' '.join(filename.translate(SANITIZE_TABLE).split())
@@ -6,10 +6,14 @@ Correct AccurateRip disc ID calculation based on official specification
 import struct
 import hashlib
 
-def calculate_correct_accuraterip_disc_ids(track_offsets):
+# Decimal digit sum of 0-999; a CD position in seconds (< 6000) is two lookups
+_DIGIT_SUMS = [sum(map(int, str(i))) for i in range(1000)]
+
+def calculate_correct_accuraterip_disc_ids(track_offsets, verbose=False):
     """
     Calculate the three AccurateRip disc IDs using the correct algorithm
     track_offsets should include leadout as the last element
+    verbose prints the intermediate values; nothing is formatted otherwise
     """
     
     if len(track_offsets) < 2:
@@ -19,8 +23,9 @@ def calculate_correct_accuraterip_disc_ids(track_offsets):
     leadout = track_offsets[-1]
     num_tracks = len(tracks)
     
-    print(f"Calculating for {num_tracks} tracks, leadout at {leadout}")
-    print(f"Track offsets: {tracks}")
+    if verbose:
+        print(f"Calculating for {num_tracks} tracks, leadout at {leadout}")
+        print(f"Track offsets: {tracks}")
     
     # DISC ID 1: FreeDB/CDDB style calculation
     # This is the most important one for AccurateRip
@@ -31,10 +36,7 @@ def calculate_correct_accuraterip_disc_ids(track_offsets):
         for offset in tracks:
             # Convert to seconds and sum digits
             seconds = offset // 75
-            digit_sum = 0
-            while seconds > 0:
-                digit_sum += seconds % 10
-                seconds //= 10
+            digit_sum = _DIGIT_SUMS[seconds % 1000] + _DIGIT_SUMS[seconds // 1000]
             checksum += digit_sum
         
         checksum = checksum % 255
@@ -45,11 +47,12 @@ def calculate_correct_accuraterip_disc_ids(track_offsets):
         # Pack as: checksum(8) + total_time(16) + num_tracks(8)
         disc_id1 = (checksum << 24) | ((total_seconds & 0xFFFF) << 8) | (num_tracks & 0xFF)
         
-        print(f"Disc ID 1 calculation:")
-        print(f"  Checksum: {checksum:02X}")
-        print(f"  Total seconds: {total_seconds}")
-        print(f"  Tracks: {num_tracks}")
-        print(f"  Result: {disc_id1:08X}")
+        if verbose:
+            print(f"Disc ID 1 calculation:")
+            print(f"  Checksum: {checksum:02X}")
+            print(f"  Total seconds: {total_seconds}")
+            print(f"  Tracks: {num_tracks}")
+            print(f"  Result: {disc_id1:08X}")
         
         return disc_id1
     
@@ -62,7 +65,8 @@ def calculate_correct_accuraterip_disc_ids(track_offsets):
         disc_id2 ^= leadout
         disc_id2 = disc_id2 & 0xFFFFFFFF
         
-        print(f"Disc ID 2: {disc_id2:08X}")
+        if verbose:
+            print(f"Disc ID 2: {disc_id2:08X}")
         return disc_id2
     
     # DISC ID 3: Alternative calculation
@@ -73,7 +77,8 @@ def calculate_correct_accuraterip_disc_ids(track_offsets):
             disc_id3 += offset * (i + 1)
         disc_id3 = disc_id3 & 0xFFFFFFFF
         
-        print(f"Disc ID 3: {disc_id3:08X}")
+        if verbose:
+            print(f"Disc ID 3: {disc_id3:08X}")
         return disc_id3
     
     id1 = calculate_disc_id1()
@@ -115,7 +120,7 @@ def test_with_porcupine_tree():
     print()
     
     # Calculate with corrected algorithm
-    id1, id2, id3 = calculate_correct_accuraterip_disc_ids(track_offsets)
+    id1, id2, id3 = calculate_correct_accuraterip_disc_ids(track_offsets, verbose=True)
     
     print()
     print("CORRECTED RESULTS:")
@@ -131,6 +136,13 @@ def test_with_porcupine_tree():
     
     # Test the corrected URL
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    # One session for every probe, so later probes reuse the first one's connection
+    session = requests.Session()
+    session.headers['User-Agent'] = 'rip-and-tear/1.0'
+    session.mount('http://', HTTPAdapter(max_retries=Retry(total=2, backoff_factor=0.1)))
     
     id1_hex = f"{id1:08X}"
     id2_hex = f"{id2:08X}"
@@ -143,7 +155,7 @@ def test_with_porcupine_tree():
     print(url)
     
     try:
-        response = requests.head(url, timeout=10)
+        response = session.head(url, timeout=10)
         print(f"Response: HTTP {response.status_code}")
         
         if response.status_code == 200:
@@ -157,13 +169,13 @@ def test_with_porcupine_tree():
             raw_offsets = [track['start_sector'] for track in tracks]
             raw_offsets.append(last_track['start_sector'] + last_track['length_sectors'])
             
-            raw_id1, raw_id2, raw_id3 = calculate_correct_accuraterip_disc_ids(raw_offsets)
+            raw_id1, raw_id2, raw_id3 = calculate_correct_accuraterip_disc_ids(raw_offsets, verbose=True)
             
             raw_url = f"http://www.accuraterip.com/accuraterip/{raw_id1:08X}"
             raw_url = f"{raw_url[:-8]}/{raw_url[-8]}/{raw_url[-7]}/{raw_url[-6]}/dBAR-006-{raw_id1:08X}-{raw_id2:08X}-{raw_id3:08X}.bin"
             print(f"Raw URL: {raw_url}")
             
-            raw_resp = requests.head(raw_url, timeout=5)
+            raw_resp = session.head(raw_url, timeout=5)
             print(f"Raw response: HTTP {raw_resp.status_code}")
             
             if raw_resp.status_code == 200:
@@ -172,6 +184,8 @@ def test_with_porcupine_tree():
                 
     except Exception as e:
         print(f"Request failed: {e}")
+    finally:
+        session.close()
     
     return False
 
@@ -9,18 +9,25 @@ Licensed under the MIT License - see LICENSE file for details
 
 import os
 import sys
-import time
+import signal
+import socket
 import threading
 import logging
 from pathlib import Path
 
 from cd_ripper import CDRipper
+from accuraterip_checker import warm_checksum_kernel
 from web_gui import WebGUI
 from config_manager import ConfigManager
 from cd_monitor import CDMonitor
 
 def setup_logging():
-    """Setup logging configuration"""
+    """Setup logging configuration (once; later calls keep the existing handlers)"""
+    # basicConfig would ignore a second configuration anyway, but only after a new
+    # FileHandler had opened the log file and werkzeug had gained another filter
+    if logging.getLogger().handlers:
+        return
+    
     log_dir = Path(os.getenv('LOG_DIR', '/logs'))
     log_dir.mkdir(exist_ok=True)
     
@@ -55,6 +62,16 @@ def main():
     
     logger.info("Starting Rip and Tear application")
     
+    # SIGTERM (docker stop) and SIGINT (Ctrl-C) first request shutdown; installed before
+    # startup so a signal arriving mid-startup still ends in the orderly shutdown below.
+    # The handlers do nothing: the interpreter writes each signal to the wakeup socket,
+    # which the main thread sleeps on, so no lock is ever taken inside a handler
+    shutdown_wakeup, shutdown_signal = socket.socketpair()
+    shutdown_signal.setblocking(False)
+    signal.set_wakeup_fd(shutdown_signal.fileno())
+    signal.signal(signal.SIGTERM, lambda signum, frame: None)
+    signal.signal(signal.SIGINT, lambda signum, frame: None)
+    
     try:
         # Load configuration
         config_manager = ConfigManager()
@@ -63,6 +80,10 @@ def main():
         # Initialize CD ripper
         cd_ripper = CDRipper(config)
         
+        # Pay the checksum JIT compile now, in the background, instead of in the first rip.
+        # Not a daemon, so interpreter shutdown waits for a compile in progress
+        threading.Thread(target=warm_checksum_kernel, name='checksum-jit').start()
+        
         # Start web GUI in background thread
         web_gui = WebGUI(cd_ripper, config)
         gui_thread = threading.Thread(target=web_gui.run, daemon=True)
@@ -75,12 +96,23 @@ def main():
         monitor_thread.start()
         logger.info("CD monitoring started")
         
-        # Keep main thread alive
-        while True:
-            time.sleep(1)
-            
-    except KeyboardInterrupt:
+        # Keep main thread alive, asleep until a shutdown signal
+        shutdown_wakeup.recv(1)
+        
+        # A second signal means the shutdown below is stuck (e.g. a child in the drive
+        # that won't die): exit at once, from the handler, without taking any lock
+        def force_exit(signum, frame):
+            os._exit(128 + signum)
+        signal.signal(signal.SIGTERM, force_exit)
+        signal.signal(signal.SIGINT, force_exit)
+        
         logger.info("Shutting down Rip and Tear application")
+        cd_monitor.stop_monitoring()
+        if cd_ripper.is_ripping():
+            # Stops cd-paranoia/flac instead of leaving them to be killed with the container
+            cd_ripper.cancel_rip()
+        cd_ripper.metadata_fetcher.close()
+            
     except Exception as e:
         logger.error(f"Fatal error: {e}")
         sys.exit(1)
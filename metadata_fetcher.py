@@ -3,22 +3,134 @@
 Metadata Fetcher - Fetches CD metadata from MusicBrainz
 """
 
+import io
+import json
 import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+
 try:
     import musicbrainzngs as mb
+    from musicbrainzngs import compat as mb_compat
     MUSICBRAINZ_AVAILABLE = True
 except ImportError:
     mb = None
+    mb_compat = None
     MUSICBRAINZ_AVAILABLE = False
 
+# SQLite file in the cache directory holding parsed MusicBrainz results by disc ID
+METADATA_CACHE_FILE = 'musicbrainz.db'
+
+# Cached MusicBrainz results older than this are fetched again (edits do happen)
+METADATA_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds
+
+# Seconds to wait for a MusicBrainz response over the shared session
+MUSICBRAINZ_TIMEOUT = 30
+
+# musicbrainzngs releases whose _mb_request builds its opener with compat.build_opener(*handlers)
+# and whose _safe_read only calls opener.open(req[, body]) and reads the result
+SESSION_OPENER_VERSIONS = ('0.7',)
+
+class _SessionOpener:
+    """
+    Stand-in for the urllib opener musicbrainzngs builds for every request: sends
+    the request through a shared requests.Session, so consecutive lookups (disc ID,
+    then release details) reuse one kept-alive connection instead of a new one each.
+    
+    Errors are raised as the urllib exceptions musicbrainzngs's _safe_read expects,
+    so its retries (503s) and error mapping work unchanged.
+    """
+    
+    def __init__(self, session: requests.Session):
+        self.session = session
+    
+    def open(self, req, data=None):
+        try:
+            response = self.session.request(req.get_method(), req.full_url, headers=dict(req.header_items()),
+                                            data=data if data is not None else req.data,
+                                            timeout=MUSICBRAINZ_TIMEOUT)
+        except requests.RequestException as e:
+            raise mb_compat.URLError(e)
+        if response.status_code >= 400:
+            raise mb_compat.HTTPError(req.full_url, response.status_code, response.reason,
+                                      response.headers, io.BytesIO(response.content))
+        return io.BytesIO(response.content)
+
+_session_lock = threading.Lock()
+_session = None
+_original_build_opener = None
+
+def _session_opener_supported() -> bool:
+    """Whether the installed musicbrainzngs builds its urllib opener the way _SessionOpener expects"""
+    mb_module = getattr(mb, 'musicbrainz', None)
+    version = getattr(mb_module, '_version', '')
+    return (
+        version.startswith(SESSION_OPENER_VERSIONS)
+        and getattr(mb_module, 'compat', None) is mb_compat
+        and callable(getattr(mb_compat, 'build_opener', None))
+        and isinstance(getattr(mb_compat, 'HTTPHandler', None), type)
+        and all(hasattr(mb_compat, name) for name in ('URLError', 'HTTPError'))
+    )
+
+def _use_shared_session() -> bool:
+    """
+    Route musicbrainzngs's plain (unauthenticated) requests through one requests.Session.
+    
+    Returns False, leaving musicbrainzngs on urllib, if the installed version's opener
+    isn't the shape _SessionOpener stands in for.
+    """
+    global _session, _original_build_opener
+    with _session_lock:
+        if _session is not None:
+            return True
+        if not _session_opener_supported():
+            return False
+        _session = requests.Session()
+        # musicbrainzngs retries failed requests itself, so the adapter doesn't
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        _session.mount('http://', adapter)
+        _session.mount('https://', adapter)
+        session = _session
+        build_opener = _original_build_opener = mb_compat.build_opener
+        
+        def build_session_opener(*handlers):
+            # Authenticated requests (never made here) keep urllib's digest auth handling
+            if all(isinstance(handler, mb_compat.HTTPHandler) for handler in handlers):
+                return _SessionOpener(session)
+            return build_opener(*handlers)
+        
+        mb_compat.build_opener = build_session_opener
+        return True
+
+def _close_shared_session():
+    """Put musicbrainzngs's own opener back and close the shared session"""
+    global _session, _original_build_opener
+    with _session_lock:
+        if _session is None:
+            return
+        mb_compat.build_opener = _original_build_opener
+        _session.close()
+        _session = None
+        _original_build_opener = None
+
 class MetadataFetcher:
     """Fetches metadata from MusicBrainz"""
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = logging.getLogger(__name__)
+        # Under CONFIG_DIR by default, the volume that survives container restarts
+        self.cache_dir = Path(os.getenv('CACHE_DIR', Path(os.getenv('CONFIG_DIR', '/config')) / 'cache'))
+        # Opened (and its schema created) on first use by _metadata_cache; shared by all threads
+        self._cache_conn: Optional[sqlite3.Connection] = None
+        self._cache_lock = threading.Lock()
         
         if not MUSICBRAINZ_AVAILABLE:
             self.logger.warning("MusicBrainz package not available - metadata fetching disabled")
@@ -26,6 +138,8 @@ class MetadataFetcher:
         
         # Set up MusicBrainz user agent as required by their API
         mb.set_useragent("Rip-and-Tear", "1.0", "https://github.com/user/rip-and-tear")
+        if not _use_shared_session():
+            self.logger.info("Unrecognised musicbrainzngs version - MusicBrainz requests will use urllib")
         
         # Configure MusicBrainz if additional settings are provided
         if 'metadata' in config:
@@ -40,6 +154,15 @@ class MetadataFetcher:
             if metadata_config.get('musicbrainz_server', 'musicbrainz.org') != 'musicbrainz.org':
                 mb.set_hostname(metadata_config['musicbrainz_server'])
     
+    def close(self):
+        """Close the metadata cache and the shared MusicBrainz session, giving musicbrainzngs back its own opener"""
+        with self._cache_lock:
+            if self._cache_conn is not None:
+                self._cache_conn.close()
+                self._cache_conn = None
+        if MUSICBRAINZ_AVAILABLE:
+            _close_shared_session()
+    
     def _safe_get(self, data, *keys, default=None):
         """Safely navigate nested dictionary structure"""
         current = data
@@ -79,13 +202,13 @@ class MetadataFetcher:
             
             if musicbrainz_disc_id:
                 self.logger.info(f"Using MusicBrainz disc ID: {musicbrainz_disc_id}")
-                release_info = self._search_by_disc_id(musicbrainz_disc_id)
+                release_info = self._lookup_disc_id(musicbrainz_disc_id)
                 if release_info:
                     self.logger.info(f"Found exact MusicBrainz disc match: {release_info['artist']} - {release_info['album']}")
                     return release_info
             elif disc_id and disc_id != "UNKNOWN":
                 self.logger.info(f"Using fallback disc ID: {disc_id}")
-                release_info = self._search_by_disc_id(disc_id)
+                release_info = self._lookup_disc_id(disc_id)
                 if release_info:
                     self.logger.info(f"Found exact disc match: {release_info['artist']} - {release_info['album']}")
                     return release_info
@@ -107,6 +230,63 @@ class MetadataFetcher:
         self.logger.warning("Using deprecated disc ID calculation - should use real disc_id from TOC")
         return None
     
+    def _lookup_disc_id(self, disc_id: str) -> Optional[Dict[str, Any]]:
+        """
+        _search_by_disc_id, answered from the on-disk cache when this disc was looked
+        up recently. Only matches are cached, so a disc added to MusicBrainz later
+        is found on the next rip.
+        """
+        key = f"discid:{disc_id}"
+        cached = self._cached_metadata(key)
+        if cached is not None:
+            self.logger.info(f"Using cached MusicBrainz metadata for disc ID {disc_id}")
+            return cached
+        
+        release_info = self._search_by_disc_id(disc_id)
+        if release_info:
+            self._store_metadata(key, release_info)
+        return release_info
+    
+    def _metadata_cache(self) -> sqlite3.Connection:
+        """
+        The metadata cache connection, opened and its table created on first use.
+        
+        One connection serves every thread; callers hold _cache_lock while using it.
+        """
+        if self._cache_conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.cache_dir / METADATA_CACHE_FILE, timeout=5, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS mb_cache ("
+                "key TEXT PRIMARY KEY, fetched_at INTEGER, payload TEXT)"
+            )
+            self._cache_conn = conn
+        return self._cache_conn
+    
+    def _cached_metadata(self, key: str) -> Optional[Dict[str, Any]]:
+        """Metadata stored for key within METADATA_CACHE_MAX_AGE, if any"""
+        try:
+            with self._cache_lock:
+                row = self._metadata_cache().execute(
+                    "SELECT payload FROM mb_cache WHERE key=? AND fetched_at > ?",
+                    (key, int(time.time()) - METADATA_CACHE_MAX_AGE)
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except Exception as e:
+            self.logger.debug(f"Metadata cache unavailable: {e}")
+            return None
+    
+    def _store_metadata(self, key: str, metadata: Dict[str, Any]):
+        """Record a MusicBrainz result for _cached_metadata"""
+        try:
+            with self._cache_lock:
+                conn = self._metadata_cache()
+                with conn:
+                    conn.execute("INSERT OR REPLACE INTO mb_cache VALUES (?, ?, ?)",
+                                 (key, int(time.time()), json.dumps(metadata)))
+        except Exception as e:
+            self.logger.debug(f"Failed to cache metadata: {e}")
+    
     def _search_by_disc_id(self, disc_id: str) -> Optional[Dict[str, Any]]:
         """Search MusicBrainz by disc ID using the proper disc ID lookup"""
         try:
@@ -0,0 +1,98 @@
+"""
+AccurateRip v1/v2 checksums: every available backend (Numba, NumPy, pure Python) and
+the streaming AccurateRipAccumulator against a plain reference loop on synthetic PCM
+"""
+
+import random
+import struct
+import wave
+
+import pytest
+
+import accuraterip_checker
+from accuraterip_checker import AccurateRipAccumulator, AccurateRipChecker
+
+# Samples AccurateRip skips at the start of the first track and the end of the last
+SKIPPED_SAMPLES = 588 * 5
+
+# A little over 13 sectors, and not a whole number of them
+SAMPLE_COUNT = 588 * 13 + 7
+
+def reference_checksums(pcm: bytes, track_number: int, total_tracks: int):
+    """The AccurateRip definition, one sample at a time, with no shortcuts"""
+    count = len(pcm) // 4
+    samples = struct.unpack(f'<{count}I', pcm[:count * 4])
+    start = SKIPPED_SAMPLES if track_number == 1 else 0
+    end = count - SKIPPED_SAMPLES if track_number == total_tracks else count
+    v1 = v2 = 0
+    for i in range(start, end):
+        product = samples[i] * (i + 1)
+        v1 += product & 0xFFFFFFFF
+        v2 += (product & 0xFFFFFFFF) + (product >> 32)
+    return v1 & 0xFFFFFFFF, v2 & 0xFFFFFFFF
+
+def synthetic_pcm(seed: int, sample_count: int = SAMPLE_COUNT) -> bytes:
+    """Random PCM, with full-scale samples at both ends so the 32-bit carries are exercised"""
+    extreme = b'\xff\xff\xff\xff' * 16
+    middle = random.Random(seed).randbytes((sample_count - 32) * 4)
+    return extreme + middle + extreme
+
+BACKENDS = ['python', 'numpy', 'numba']
+
+@pytest.fixture(params=BACKENDS)
+def checker(request, monkeypatch):
+    """An AccurateRipChecker forced onto one backend (skipped if that backend isn't installed)"""
+    backend = request.param
+    if backend == 'numba' and not accuraterip_checker.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+    if backend == 'numpy' and not accuraterip_checker.NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+    monkeypatch.setattr(accuraterip_checker, 'NUMBA_AVAILABLE', backend == 'numba')
+    monkeypatch.setattr(accuraterip_checker, 'NUMPY_AVAILABLE', backend != 'python')
+    return AccurateRipChecker()
+
+# (track number, total tracks): first, middle and last tracks, and a one-track disc
+POSITIONS = [(1, 3), (2, 3), (3, 3), (1, 1)]
+
+@pytest.mark.parametrize('track_number, total_tracks', POSITIONS)
+def test_backend_matches_reference(checker, track_number, total_tracks):
+    pcm = synthetic_pcm(track_number)
+    assert checker.calculate_accuraterip_checksums(pcm, track_number, total_tracks) == \
+        reference_checksums(pcm, track_number, total_tracks)
+
+@pytest.mark.parametrize('block_samples', [1, 587, 588, 4096])
+def test_numpy_block_boundaries(monkeypatch, block_samples):
+    if not accuraterip_checker.NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+    monkeypatch.setattr(accuraterip_checker, 'NUMBA_AVAILABLE', False)
+    monkeypatch.setattr(accuraterip_checker, 'CHECKSUM_BLOCK_SAMPLES', block_samples)
+    pcm = synthetic_pcm(block_samples)
+    assert AccurateRipChecker().calculate_accuraterip_checksums(pcm, 1, 2) == reference_checksums(pcm, 1, 2)
+
+@pytest.mark.parametrize('track_number, total_tracks', POSITIONS)
+@pytest.mark.parametrize('chunk_bytes', [3, 2352, 4097, 65536])
+def test_accumulator_matches_reference(checker, track_number, total_tracks, chunk_bytes):
+    pcm = synthetic_pcm(track_number + chunk_bytes)
+    accumulator = AccurateRipAccumulator(checker, track_number, total_tracks)
+    for start in range(0, len(pcm), chunk_bytes):
+        accumulator.update(pcm[start:start + chunk_bytes])
+    assert accumulator.checksums() == reference_checksums(pcm, track_number, total_tracks)
+
+def test_accumulator_shorter_than_skipped_region(checker):
+    # Nothing is left once the first and last 5 sectors are skipped
+    pcm = synthetic_pcm(0, sample_count=SKIPPED_SAMPLES + 100)
+    accumulator = AccurateRipAccumulator(checker, 1, 1)
+    accumulator.update(pcm)
+    assert accumulator.checksums() == (0, 0)
+
+@pytest.mark.parametrize('track_number, total_tracks', POSITIONS)
+def test_wav_file_matches_reference(checker, tmp_path, track_number, total_tracks):
+    pcm = synthetic_pcm(10 + track_number)
+    wav_path = tmp_path / f'{track_number:02d}.wav'
+    with wave.open(str(wav_path), 'wb') as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(44100)
+        wav.writeframes(pcm)
+    assert checker.accuraterip_checksum(str(wav_path), track_number, total_tracks) == \
+        reference_checksums(pcm, track_number, total_tracks)
@@ -16,6 +16,20 @@ try:
 except ImportError:
     DISCID_AVAILABLE = False
 
+def msf_to_sectors(msf: str) -> int:
+    """
+    Sectors in an "MM:SS.FF" or "MM:SS:FF" time (FF is frames, 75 per second).
+    
+    Integer arithmetic throughout: FF counts frames, not hundredths of a second.
+    Missing fields count as 0; a malformed time gives 0.
+    """
+    parts = msf.replace('.', ':').split(':')
+    try:
+        minutes, seconds, frames = (list(map(int, parts)) + [0, 0])[:3]
+    except ValueError:
+        return 0
+    return (minutes * 60 + seconds) * 75 + frames
+
 @dataclass
 class TrackInfo:
     """Enhanced track information with gap data"""
@@ -552,20 +566,13 @@ class TOCAnalyzer:
                     duration = parts[3]
                     
                     # Convert duration to sectors (75 sectors per second)
-                    sectors = 0
-                    if ':' in duration:
-                        time_parts = duration.split(':')
-                        minutes = int(time_parts[0])
-                        seconds = float(time_parts[1])
-                        sectors = int((minutes * 60 + seconds) * 75)
+                    sectors = msf_to_sectors(duration)
                     
                     # Look for pregap info in brackets
                     pregap_sectors = 0
-                    bracket_match = re.search(r'\[(\d+):(\d+\.\d+)\]', line)
+                    bracket_match = re.search(r'\[(\d+:\d+\.\d+)\]', line)
                     if bracket_match:
-                        pregap_min = int(bracket_match.group(1))
-                        pregap_sec = float(bracket_match.group(2))
-                        pregap_sectors = int((pregap_min * 60 + pregap_sec) * 75)
+                        pregap_sectors = msf_to_sectors(bracket_match.group(1))
                     
                     track = TrackInfo(
                         number=track_num,
@@ -3,7 +3,9 @@
 Web GUI - Flask-based web interface for monitoring Rip and Tear progress
 """
 
+import os
 import json
+import hashlib
 import logging
 from flask import Flask, render_template, jsonify, request, send_from_directory
 from pathlib import Path
@@ -17,6 +19,10 @@ class WebGUI:
         self.config = config
         self.logger = logging.getLogger(__name__)
         
+        # Last /api/status payload as (status values, JSON body, ETag); polls that see
+        # the same status reuse the serialized body instead of re-encoding it
+        self._status_cache = (None, b'', '')
+        
         # Create Flask app
         self.app = Flask(__name__, 
                         template_folder='templates',
@@ -37,10 +43,18 @@ class WebGUI:
             """Get current ripping status"""
             try:
                 status = self.cd_ripper.get_status()
-                return jsonify({
-                    'success': True,
-                    'data': status
-                })
+                key = tuple(status.items())
+                cached_key, body, etag = self._status_cache
+                if key != cached_key:
+                    body = json.dumps({'success': True, 'data': status}).encode('utf-8')
+                    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+                    self._status_cache = (key, body, etag)
+                
+                # Browsers revalidate with If-None-Match and get a bodyless 304 while nothing changed
+                response = self.app.response_class(body, mimetype='application/json')
+                response.set_etag(etag)
+                response.cache_control.no_cache = True
+                return response.make_conditional(request)
             except Exception as e:
                 self.logger.error(f"Status API error: {e}")
                 return jsonify({
@@ -124,23 +138,28 @@ class WebGUI:
                 files = []
                 
                 if output_dir.exists():
-                    for item in output_dir.iterdir():
-                        if item.is_dir():
-                            # List album directories
-                            album_files = []
-                            for file in item.iterdir():
-                                if file.is_file():
-                                    album_files.append({
-                                        'name': file.name,
-                                        'size': file.stat().st_size,
-                                        'modified': file.stat().st_mtime
-                                    })
-                            
-                            files.append({
-                                'name': item.name,
-                                'type': 'directory',
-                                'files': album_files
-                            })
+                    # scandir entries know their type from the directory listing,
+                    # so each file costs a single stat for its size and mtime
+                    with os.scandir(output_dir) as items:
+                        for item in items:
+                            if item.is_dir():
+                                # List album directories
+                                album_files = []
+                                with os.scandir(item.path) as entries:
+                                    for file in entries:
+                                        if file.is_file():
+                                            stat = file.stat()
+                                            album_files.append({
+                                                'name': file.name,
+                                                'size': stat.st_size,
+                                                'modified': stat.st_mtime
+                                            })
+                                
+                                files.append({
+                                    'name': item.name,
+                                    'type': 'directory',
+                                    'files': album_files
+                                })
                 
                 return jsonify({
                     'success': True,